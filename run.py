@@ -4,97 +4,63 @@ ReolinkANPR Startup Script
 Starts both the ANPR service and web dashboard
 """
 
+import asyncio
 import os
-import sys
-import time
 import signal
-import subprocess
+import sys
 from pathlib import Path
 
 
-def main():
-    print("=" * 60)
-    print("ReolinkANPR - Starting...")
-    print("=" * 60)
-
-    # Check Python version
-    if sys.version_info < (3, 11):
-        print(f"ERROR: Python 3.11+ required (you have {sys.version_info.major}.{sys.version_info.minor})")
-        print("TCP push events require reolink-aio 0.10+ which needs Python 3.11+")
-        print("Please upgrade Python or use pyenv/venv with Python 3.11+")
-        sys.exit(1)
-
-    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}: OK")
-    print()
-
-    # Get script directory
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
-
+async def supervise():
+    """Start both children and wait until either exits or we're stopped."""
     processes = []
     log_files = []
+    stop_event = asyncio.Event()
 
-    def signal_handler(signum, frame):
-        print("\nShutting down ReolinkANPR...")
-        for proc in processes:
-            if proc and proc.poll() is None:
-                proc.terminate()
-        time.sleep(2)
-        for proc in processes:
-            if proc and proc.poll() is None:
-                proc.kill()
-        # Close log files
-        for log_file in log_files:
-            try:
-                log_file.close()
-            except:
-                pass
-        print("ReolinkANPR stopped")
-        sys.exit(0)
-
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
 
     try:
-        # Create log files for processes
-        web_log = open("logs/web.log", "w")
-        anpr_log = open("logs/anpr_startup.log", "w")
+        # Create log fds for the children - raw append fds, no Python
+        # text layer (the children write straight to the fd anyway) and
+        # O_CLOEXEC so our copy never leaks across any other exec
+        log_flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC
+        web_log = os.open("logs/web.log", log_flags, 0o644)
+        anpr_log = os.open("logs/anpr_startup.log", log_flags, 0o644)
         log_files.extend([web_log, anpr_log])
 
         # Start web dashboard
         print("Starting web dashboard...")
-        web_proc = subprocess.Popen(
-            [sys.executable, "web/app.py"],
+        web_proc = await asyncio.create_subprocess_exec(
+            sys.executable, "web/app.py",
             stdout=web_log,
-            stderr=subprocess.STDOUT
+            stderr=asyncio.subprocess.STDOUT
         )
         processes.append(web_proc)
-        time.sleep(2)
+        await asyncio.sleep(2)
 
         # Check if web dashboard started successfully
-        if web_proc.poll() is not None:
-            web_log.close()
+        if web_proc.returncode is not None:
             print("ERROR: Web dashboard failed to start!")
             print("Check logs at: logs/web.log")
-            sys.exit(1)
+            return 1
 
         # Start ANPR service
         print("Starting ANPR service...")
-        anpr_proc = subprocess.Popen(
-            [sys.executable, "-m", "src.anpr_service"],
+        anpr_proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.anpr_service",
             stdout=anpr_log,
-            stderr=subprocess.STDOUT
+            stderr=asyncio.subprocess.STDOUT
         )
         processes.append(anpr_proc)
-        time.sleep(2)
+        await asyncio.sleep(2)
 
         # Check if ANPR service started successfully
-        if anpr_proc.poll() is not None:
-            anpr_log.close()
+        if anpr_proc.returncode is not None:
             print("ERROR: ANPR service failed to start!")
             print("Check logs at: logs/anpr.log and logs/anpr_startup.log")
-            sys.exit(1)
+            return 1
 
         # Read port from config
         try:
@@ -112,23 +78,68 @@ def main():
         print("Press Ctrl+C to stop")
         print("=" * 60)
 
-        # Monitor processes
-        while True:
-            time.sleep(5)
+        # Wait for a shutdown signal or the first child to die - no polling
+        waiters = {
+            asyncio.create_task(web_proc.wait(), name="web"),
+            asyncio.create_task(anpr_proc.wait(), name="anpr"),
+            asyncio.create_task(stop_event.wait(), name="signal"),
+        }
+        done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in pending:
+            task.cancel()
 
-            if web_proc.poll() is not None:
-                print("Web dashboard stopped unexpectedly!")
-                break
+        finished = done.pop().get_name()
+        if finished == "web":
+            print("Web dashboard stopped unexpectedly!")
+        elif finished == "anpr":
+            print("ANPR service stopped unexpectedly!")
 
-            if anpr_proc.poll() is not None:
-                print("ANPR service stopped unexpectedly!")
-                break
+        return 0
 
+    finally:
+        print("\nShutting down ReolinkANPR...")
+        for proc in processes:
+            if proc.returncode is None:
+                proc.terminate()
+        await asyncio.sleep(2)
+        for proc in processes:
+            if proc.returncode is None:
+                proc.kill()
+        # Close log fds
+        for log_fd in log_files:
+            try:
+                os.close(log_fd)
+            except OSError:
+                pass
+        print("ReolinkANPR stopped")
+
+
+def main():
+    print("=" * 60)
+    print("ReolinkANPR - Starting...")
+    print("=" * 60)
+
+    # Check Python version
+    if sys.version_info < (3, 11):
+        print(f"ERROR: Python 3.11+ required (you have {sys.version_info.major}.{sys.version_info.minor})")
+        print("TCP push events require reolink-aio 0.10+ which needs Python 3.11+")
+        print("Please upgrade Python or use pyenv/venv with Python 3.11+")
+        sys.exit(1)
+
+    print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}: OK")
+    print()
+
+    # Get script directory
+    script_dir = Path(__file__).parent
+    os.chdir(script_dir)
+
+    try:
+        sys.exit(asyncio.run(supervise()))
     except KeyboardInterrupt:
-        signal_handler(signal.SIGINT, None)
+        sys.exit(0)
     except Exception as e:
         print(f"Error: {e}")
-        signal_handler(signal.SIGTERM, None)
         sys.exit(1)
 
 
@@ -2,9 +2,13 @@
 
 import cv2
 import numpy as np
+import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from .logger import logger
 
@@ -15,25 +19,532 @@ except ImportError:
     FAST_ALPR_AVAILABLE = False
     logger.error("fast-alpr not available! Install with: pip install fast-alpr")
 
+# Optional GPU JPEG decode (nvJPEG via torchvision) - one batched decode
+# call replaces per-frame CPU libjpeg when CUDA is available
+try:
+    import torch
+    import torchvision.io
+    TORCH_CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    TORCH_CUDA_AVAILABLE = False
+
+# onnxruntime ships with fast-alpr; used for IOBinding on CUDA sessions
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Optional Numba JIT for the plate-format validator - a compiled state
+# machine beats the regex engine on short strings
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _plate_fsm(buf: np.ndarray) -> bool:
+        """State machine equivalent of ALPRProcessor.PLATE_PATTERN.
+
+        Valid plates are a run of letters, a run of digits, then an
+        optional run of letters, with run lengths matching one of the
+        four accepted formats.
+        """
+        n = buf.shape[0]
+        if n < 2 or n > 7:
+            return False
+
+        i = 0
+        lead = 0
+        while i < n and 65 <= buf[i] <= 90:  # A-Z
+            lead += 1
+            i += 1
+        digits = 0
+        while i < n and 48 <= buf[i] <= 57:  # 0-9
+            digits += 1
+            i += 1
+        tail = 0
+        while i < n and 65 <= buf[i] <= 90:
+            tail += 1
+            i += 1
+
+        if i != n or lead == 0 or digits == 0:
+            return False
+
+        if tail == 0:
+            return 1 <= lead <= 3 and 1 <= digits <= 4
+        return ((lead == 2 and digits == 2 and tail == 3)
+                or (lead == 1 and digits <= 3 and tail == 3)
+                or (lead == 3 and digits <= 3 and tail == 1))
+
+    # Trigger compilation at import so the first detection doesn't pay it
+    _plate_fsm(np.frombuffer(b'AB12CDE', np.uint8))
+
+
+# ALPR instances keyed by (detector_model, ocr_model) - config reloads
+# reuse the already-initialized (and warmed-up) models instead of paying
+# ONNX graph optimization and kernel autotuning again
+_ALPR_CACHE: Dict[Tuple[str, str], "ALPR"] = {}
+
+
+class NdArrayPool:
+    """Recycle ndarrays of repeating shapes across detection events.
+
+    Every TCP-push event allocates the same scratch buffers (detector
+    input batches, downscaled probes) and hands them straight to the
+    garbage collector. Pooling them keeps steady-state processing free
+    of large allocations.
+    """
+
+    def __init__(self, max_per_key: int = 4):
+        self._pools: Dict[Tuple, deque] = {}
+        self._max_per_key = max_per_key
+
+    def acquire(self, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """Get a buffer of the given shape/dtype, reusing one if possible."""
+        pool = self._pools.get((shape, np.dtype(dtype).str))
+        if pool:
+            return pool.popleft()
+        return np.empty(shape, dtype)
+
+    def release(self, array: np.ndarray):
+        """Return a buffer to the pool for reuse."""
+        key = (array.shape, array.dtype.str)
+        pool = self._pools.setdefault(key, deque())
+        if len(pool) < self._max_per_key:
+            pool.append(array)
+
 
 class ALPRProcessor:
     """Process images for license plate recognition using FastALPR."""
 
+    # Frame gate thresholds (probe pass at 1/8 scale)
+    MOTION_THRESHOLD = 2.0   # Mean absdiff below this = near-duplicate frame
+    BLUR_THRESHOLD = 25.0    # Laplacian variance below this = too blurry
+
+    # Single fused plate pattern, compiled once at class definition.
+    # Alternations: UK current (AA00AAA), prefix/suffix (A123ABC / ABC123A),
+    # and generic letters+digits formats
+    PLATE_PATTERN = re.compile(
+        r'^(?:[A-Z]{2}\d{2}[A-Z]{3}'
+        r'|[A-Z]\d{1,3}[A-Z]{3}'
+        r'|[A-Z]{3}\d{1,3}[A-Z]'
+        r'|[A-Z]{1,3}\d{1,4})$'
+    )
+
     def __init__(self, config):
         self.config = config
 
         if not FAST_ALPR_AVAILABLE:
             raise ImportError("fast-alpr library not available")
 
-        # Initialize FastALPR with configured models
-        self.alpr = ALPR(
-            detector_model=config.detector_model,
-            ocr_model=config.ocr_model,
-            detector_conf_thresh=0.1  # Detection confidence (lower than recognition threshold)
+        # Optionally convert locally-supplied models - INT8 for CPU,
+        # FP16 for GPU (hub model names pass through untouched)
+        detector_model = config.detector_model
+        ocr_model = config.ocr_model
+        if config.alpr_precision == 'int8':
+            detector_model = self._quantize_if_local(detector_model)
+            ocr_model = self._quantize_if_local(ocr_model)
+        elif config.alpr_precision == 'fp16':
+            detector_model = self._convert_fp16_if_local(detector_model)
+            ocr_model = self._convert_fp16_if_local(ocr_model)
+        elif config.alpr_precision != 'fp32':
+            logger.warning(
+                f"Unknown alpr.precision '{config.alpr_precision}' - using fp32 models"
+            )
+
+        # Initialize FastALPR with configured models (cached across
+        # reloads so hot-reloading config doesn't recompile the models)
+        cache_key = (detector_model, ocr_model)
+        self.alpr = _ALPR_CACHE.get(cache_key)
+        if self.alpr is None:
+            self.alpr = ALPR(
+                detector_model=detector_model,
+                ocr_model=ocr_model,
+                detector_conf_thresh=0.1  # Detection confidence (lower than recognition threshold)
+            )
+            self._warmup()
+            _ALPR_CACHE[cache_key] = self.alpr
+
+        # Decode pool - cv2.imdecode releases the GIL inside libjpeg-turbo,
+        # so threads give real parallelism for JPEG decoding
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix="alpr-decode"
+        )
+
+        # Scratch-buffer pool, lifetime bound to this processor so the
+        # recurring per-event allocations disappear from steady state
+        self._buffer_pool = NdArrayPool()
+
+        # Writer pool - result images are encoded and written off the
+        # caller's (event loop) thread so saves overlap the DB insert
+        # and notification sends
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="alpr-io"
         )
 
         logger.info(f"FastALPR initialized with {config.detector_model}")
 
+    def _warmup(self):
+        """Run one dummy prediction so the first real event pays no cold start.
+
+        The first predict call triggers ONNX graph optimization (and
+        cuDNN autotuning on GPU); doing it at init with a blank frame
+        moves that cost out of the detection path.
+        """
+        try:
+            self.alpr.predict(np.zeros((640, 640, 3), np.uint8))
+            logger.debug("ALPR warm-up prediction complete")
+        except Exception as e:
+            logger.debug(f"ALPR warm-up failed (non-fatal): {e}")
+
+    @staticmethod
+    def _quantize_if_local(model: str) -> str:
+        """
+        Produce an INT8-quantized copy of a local ONNX model, once.
+
+        Only applies when the configured model is a path to an .onnx file
+        (hub model names pass through untouched). The quantized file is
+        written next to the original and reused on later startups. Halves
+        weight bandwidth and roughly doubles CPU throughput with
+        negligible accuracy loss on plates.
+        """
+        model_path = Path(model)
+        if model_path.suffix != '.onnx' or not model_path.exists():
+            return model
+
+        quantized_path = model_path.with_name(f"{model_path.stem}-int8.onnx")
+        if quantized_path.exists():
+            return str(quantized_path)
+
+        try:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            logger.info(f"Quantizing {model_path.name} to INT8 (one-time)...")
+            quantize_dynamic(str(model_path), str(quantized_path), weight_type=QuantType.QInt8)
+            return str(quantized_path)
+        except Exception as e:
+            logger.warning(f"INT8 quantization failed, using fp32 model: {e}")
+            return model
+
+    @staticmethod
+    def _convert_fp16_if_local(model: str) -> str:
+        """
+        Produce an FP16 copy of a local ONNX model, once.
+
+        Mirrors _quantize_if_local: local .onnx paths are converted next
+        to the original and reused on later startups, hub model names
+        pass through untouched. Half-precision weights halve device
+        memory traffic on CUDA. Requires onnxconverter-common; falls
+        back to the fp32 model with a warning when it isn't installed.
+        """
+        model_path = Path(model)
+        if model_path.suffix != '.onnx' or not model_path.exists():
+            return model
+
+        converted_path = model_path.with_name(f"{model_path.stem}-fp16.onnx")
+        if converted_path.exists():
+            return str(converted_path)
+
+        try:
+            import onnx
+            from onnxconverter_common import float16
+            logger.info(f"Converting {model_path.name} to FP16 (one-time)...")
+            model_fp16 = float16.convert_float_to_float16(onnx.load(str(model_path)))
+            onnx.save(model_fp16, str(converted_path))
+            return str(converted_path)
+        except Exception as e:
+            logger.warning(f"FP16 conversion failed, using fp32 model: {e}")
+            return model
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_valid_plate(text: str) -> bool:
+        """
+        Check whether an OCR string looks like a real plate.
+
+        Uses the Numba-compiled state machine when available, falling
+        back to the single precompiled alternation; results are memoized
+        since OCR tends to return the same string across adjacent frames.
+        """
+        if NUMBA_AVAILABLE:
+            return bool(_plate_fsm(np.frombuffer(text.encode('ascii', 'replace'), np.uint8)))
+        return bool(ALPRProcessor.PLATE_PATTERN.match(text))
+
+    @staticmethod
+    def _crop_plate(img: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Extract the plate region as a contiguous array.
+
+        Uses warpAffine (OpenCV's SIMD path, runs in C with the GIL
+        released) instead of numpy slicing, so the result is contiguous
+        and the JPEG encoder doesn't have to walk a strided view.
+        """
+        x1, y1, x2, y2 = bbox
+        w, h = max(x2 - x1, 1), max(y2 - y1, 1)
+        matrix = np.float32([[1, 0, -x1], [0, 1, -y1]])
+        return cv2.warpAffine(img, matrix, (w, h), flags=cv2.INTER_LINEAR)
+
+    @staticmethod
+    def _write_image(path: Path, img: np.ndarray, jpeg_params: List[int]):
+        """Encode and publish an image atomically.
+
+        Writes under a temporary name in the same directory and renames
+        into place, so the final path never names a half-written JPEG.
+        """
+        tmp_path = path.with_name(f"{path.stem}.tmp{path.suffix}")
+        if not cv2.imwrite(str(tmp_path), img, jpeg_params):
+            raise IOError(f"cv2.imwrite failed for {path}")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _log_write_result(future):
+        """Surface background image-write failures in the log."""
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Failed to save detection image: {exc}")
+
+    @staticmethod
+    def _decode_frame(frame: "bytes | np.ndarray") -> Optional[np.ndarray]:
+        """Decode a JPEG frame to a BGR array (None on failure).
+
+        Frames that arrive already decoded (streaming capture hands over
+        raw BGR arrays) pass through untouched.
+        """
+        if isinstance(frame, np.ndarray) and frame.ndim == 3:
+            return frame
+        return cv2.imdecode(np.frombuffer(frame, np.uint8), cv2.IMREAD_COLOR)
+
+    def _decode_frames(self, frame_bytes_list: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Decode all frames, preferring GPU batch decode when available."""
+        if TORCH_CUDA_AVAILABLE and frame_bytes_list and not isinstance(frame_bytes_list[0], np.ndarray):
+            images = self._decode_frames_gpu(frame_bytes_list)
+            if images is not None:
+                return images
+        return list(self._decode_pool.map(self._decode_frame, frame_bytes_list))
+
+    @staticmethod
+    def _decode_frames_gpu(frame_bytes_list: List[bytes]) -> Optional[List[Optional[np.ndarray]]]:
+        """
+        Decode the whole frame list in one nvJPEG invocation on the GPU.
+
+        Returns BGR arrays matching the CPU path, or None on any failure
+        so the caller falls back to libjpeg decoding.
+        """
+        try:
+            tensors = [
+                torch.frombuffer(bytearray(b), dtype=torch.uint8)
+                for b in frame_bytes_list
+            ]
+            decoded = torchvision.io.decode_jpeg(tensors, device='cuda')
+            # RGB CHW on device -> BGR HWC on host to match cv2.imdecode
+            return [
+                t.flip(0).permute(1, 2, 0).cpu().numpy()
+                for t in decoded
+            ]
+        except Exception as e:
+            logger.debug(f"GPU JPEG decode unavailable, falling back to CPU: {e}")
+            return None
+
+    def _gate_frames(self, frame_bytes_list: List[bytes]) -> List[int]:
+        """
+        Cheap probe pass that picks which frames deserve the detector.
+
+        Decodes each frame at 1/8 scale (roughly 8x cheaper than a full
+        JPEG decode) and skips frames that barely differ from the last
+        accepted frame or are too blurry for OCR to read a plate.
+
+        Returns:
+            Indices of frames that passed the gate
+        """
+        accepted = []
+        prev_small = None
+
+        for i, frame in enumerate(frame_bytes_list):
+            if isinstance(frame, np.ndarray):
+                # Already decoded (streaming capture) - just downscale
+                small = cv2.resize(
+                    frame, (frame.shape[1] // 8, frame.shape[0] // 8),
+                    interpolation=cv2.INTER_AREA
+                )
+            else:
+                small = cv2.imdecode(
+                    np.frombuffer(frame, np.uint8),
+                    cv2.IMREAD_REDUCED_COLOR_8
+                )
+            if small is None:
+                continue
+
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+            # Skip near-duplicates of the last accepted frame
+            if prev_small is not None:
+                motion = cv2.absdiff(prev_small, gray).mean()
+                if motion < self.MOTION_THRESHOLD:
+                    continue
+
+            # Skip frames too blurry to OCR. CV_64F keeps the negative
+            # filter responses - CV_8U saturates them to 0, which halves
+            # the variance and mis-rejects dark/IR frames
+            blur = cv2.Laplacian(gray, cv2.CV_64F).var()
+            if blur < self.BLUR_THRESHOLD:
+                continue
+
+            accepted.append(i)
+            prev_small = gray
+
+        # Fail open: a gate that rejects everything (e.g. a noisy night
+        # clip tripping the blur threshold) must not turn into zero
+        # detections - fall back to a first/middle/last sample
+        if not accepted and frame_bytes_list:
+            accepted = sorted({0, len(frame_bytes_list) // 2, len(frame_bytes_list) - 1})
+            logger.warning(
+                f"Frame gate rejected all {len(frame_bytes_list)} frames - "
+                f"falling back to {len(accepted)} sample frames"
+            )
+
+        return accepted
+
+    def _detector_session(self):
+        """Best-effort access to the detector's raw ONNX session for batched runs."""
+        for attr in ('model', 'session', 'ort_session'):
+            session = getattr(self.alpr.detector, attr, None)
+            if session is not None and hasattr(session, 'run') and hasattr(session, 'get_inputs'):
+                return session
+        return None
+
+    def process_frames_batch(
+        self,
+        frame_bytes_list: List[bytes],
+        save_dir: Path
+    ) -> Optional[Dict]:
+        """
+        Process frames with batched decode, amortizing per-frame overhead.
+
+        Decodes all frames up front on a thread pool (parallel libjpeg),
+        then feeds them through detection/OCR. When the detector exposes an
+        ONNX session with a dynamic batch dimension the detection stage is
+        submitted as one batched run; otherwise it falls back to the
+        per-frame predict path on the already-decoded arrays.
+
+        Args:
+            frame_bytes_list: Frames as JPEG bytes or decoded BGR arrays
+            save_dir: Directory to save images
+
+        Returns:
+            Dict with plate info and paths, or None if no plate found
+        """
+        if not frame_bytes_list:
+            logger.warning("No frames provided for processing")
+            return None
+
+        logger.info(f"Batch processing {len(frame_bytes_list)} frames...")
+
+        # Probe pass: drop near-duplicate and blurry frames before paying
+        # full decode + detector cost
+        gated = self._gate_frames(frame_bytes_list)
+        logger.info(f"Frame gate: {len(gated)}/{len(frame_bytes_list)} frames passed")
+
+        images = self._decode_frames([frame_bytes_list[i] for i in gated])
+        decoded = [(gated[n], img) for n, img in enumerate(images) if img is not None]
+
+        if not decoded:
+            logger.warning("Failed to decode any frames")
+            return None
+
+        # Try a single batched detection pass over all decoded frames
+        candidate_indices = self._batched_detection_gate([img for _, img in decoded])
+        prefiltered = candidate_indices is not None
+        if prefiltered:
+            decoded = [decoded[i] for i in candidate_indices]
+            logger.info(f"Batched detection: {len(decoded)} frames with plate candidates")
+
+        return self._process_decoded(decoded, frame_bytes_list, save_dir,
+                                     prefiltered=prefiltered)
+
+    def _batched_detection_gate(self, images: List[np.ndarray]) -> Optional[List[int]]:
+        """
+        Run the detector over all images as one NCHW batch if possible.
+
+        Returns indices of images with at least one detection. Returns
+        None - the caller falls back to the per-frame path - when the
+        model doesn't support batching, when anything in the hand-rolled
+        preprocessing goes wrong, or when the batch reports no candidate
+        in any frame (an all-empty clip right after a motion trigger is
+        far more likely a preprocessing mismatch than a real miss, so
+        the gate fails open rather than discarding the event).
+        """
+        session = self._detector_session()
+        if session is None:
+            return None
+
+        try:
+            input_meta = session.get_inputs()[0]
+            batch_dim = input_meta.shape[0]
+            if isinstance(batch_dim, int) and batch_dim == 1:
+                return None  # Model exported with fixed batch=1
+
+            # Stretch-resize all frames into one preallocated batch,
+            # matching the session's input precision (fp16 models
+            # included). No letterboxing - plate aspect distortion is
+            # tolerable for a present/absent gate
+            _, _, in_h, in_w = [d if isinstance(d, int) else 640 for d in input_meta.shape]
+            dtype = np.float16 if 'float16' in input_meta.type else np.float32
+            batch = self._buffer_pool.acquire((len(images), 3, in_h, in_w), dtype)
+            try:
+                for i, img in enumerate(images):
+                    resized = cv2.resize(img, (in_w, in_h), interpolation=cv2.INTER_LINEAR)
+                    # The YOLO detectors are trained on RGB; frames are BGR
+                    rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+                    batch[i] = rgb.transpose(2, 0, 1).astype(dtype) / 255.0
+
+                outputs = self._run_session_batched(session, input_meta.name, batch)
+            finally:
+                self._buffer_pool.release(batch)
+
+            # End2end YOLO models emit per-image detection counts first
+            num_dets = np.asarray(outputs[0]).reshape(len(images), -1)
+            candidates = [i for i in range(len(images)) if num_dets[i].max() > 0]
+            if not candidates:
+                logger.debug("Batched detection found no candidates - using per-frame path")
+                return None
+            return candidates
+
+        except Exception as e:
+            logger.debug(f"Batched detection unavailable, using per-frame path: {e}")
+            return None
+
+    @staticmethod
+    def _run_session_batched(session, input_name: str, batch: np.ndarray) -> List[np.ndarray]:
+        """
+        Run a batched inference, using IOBinding on CUDA sessions.
+
+        With the CUDA execution provider a plain session.run copies the
+        numpy input host-to-device and every output device-to-host.
+        IOBinding stages the input on the device once and only the final
+        outputs come back via copy_outputs_to_cpu. CPU sessions just run
+        directly - there is nothing to save.
+        """
+        if (ONNXRUNTIME_AVAILABLE
+                and hasattr(session, 'get_providers')
+                and 'CUDAExecutionProvider' in session.get_providers()):
+            try:
+                io = session.io_binding()
+                ort_input = onnxruntime.OrtValue.ortvalue_from_numpy(batch, 'cuda', 0)
+                io.bind_ortvalue_input(input_name, ort_input)
+                for output in session.get_outputs():
+                    io.bind_output(output.name, 'cuda')
+                session.run_with_iobinding(io)
+                return io.copy_outputs_to_cpu()
+            except Exception as e:
+                logger.debug(f"IOBinding path failed, using plain run: {e}")
+
+        return session.run(None, {input_name: batch})
+
     def process_frames(
         self,
         frame_bytes_list: List[bytes],
@@ -43,7 +554,7 @@ class ALPRProcessor:
         Process multiple frames and return the best result.
 
         Args:
-            frame_bytes_list: List of frame bytes to process
+            frame_bytes_list: Frames as JPEG bytes or decoded BGR arrays
             save_dir: Directory to save images
 
         Returns:
@@ -55,34 +566,66 @@ class ALPRProcessor:
 
         logger.info(f"Processing {len(frame_bytes_list)} frames...")
 
-        best_result = None
-        best_confidence = 0.0
-        best_image = None
-        best_plate_crop = None
+        # Probe pass: drop near-duplicate and blurry frames before paying
+        # full decode + detector cost
+        gated = self._gate_frames(frame_bytes_list)
+        logger.info(f"Frame gate: {len(gated)}/{len(frame_bytes_list)} frames passed")
 
-        for i, frame_bytes in enumerate(frame_bytes_list):
-            try:
-                # Decode image
-                image_array = np.frombuffer(frame_bytes, np.uint8)
-                img = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
+        # Decode on the thread pool and consume lazily, so decoding of
+        # frame N+1 overlaps inference on frame N (libjpeg releases the GIL)
+        decoded_iter = self._decode_pool.map(
+            self._decode_frame, (frame_bytes_list[i] for i in gated)
+        )
 
+        def decoded():
+            for i, img in zip(gated, decoded_iter):
                 if img is None:
                     logger.warning(f"Failed to decode frame {i+1}")
                     continue
+                yield i, img
 
-                # Run detection-only first (lighter weight)
-                detections = self.alpr.detector.predict(img)
+        return self._process_decoded(decoded(), frame_bytes_list, save_dir)
 
-                if not detections:
-                    if (i+1) % 20 == 0:  # Log every 20th frame to reduce noise
-                        logger.debug(f"Frame {i+1}: No plates detected")
-                    continue
+    def _process_decoded(
+        self,
+        decoded: Iterable[Tuple[int, np.ndarray]],
+        frame_bytes_list: List[bytes],
+        save_dir: Path,
+        prefiltered: bool = False
+    ) -> Optional[Dict]:
+        """Run detection + OCR over decoded frames and save the best result.
+
+        With prefiltered=True the frames are known to contain plate
+        candidates (the batched gate established that), so the
+        detection-only pre-check is skipped instead of running the
+        detector a second time per frame.
+        """
+        # One timestamp per event, shared by every path that writes files
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        best_result = None
+        best_confidence = 0.0
+        best_image = None
+        best_bbox = None
+        best_plate_text = None
+
+        for i, img in decoded:
+            try:
+                # Run detection-only first (lighter weight) - unless the
+                # batched gate already confirmed this frame has candidates
+                if not prefiltered:
+                    detections = self.alpr.detector.predict(img)
+
+                    if not detections:
+                        if (i+1) % 20 == 0:  # Log every 20th frame to reduce noise
+                            logger.debug(f"Frame {i+1}: No plates detected")
+                        continue
 
                 # Run full ALPR (detection + OCR) on frames with detections
                 results = self.alpr.predict(img)
 
                 if not results:
-                    logger.debug(f"Frame {i+1}: Detected {len(detections)} plates but OCR failed")
+                    logger.debug(f"Frame {i+1}: Plate detected but OCR failed")
                     continue
 
                 # Process each detection
@@ -96,6 +639,13 @@ class ALPRProcessor:
                         logger.debug(f"Frame {i+1}: Low confidence {ocr_confidence:.3f} for {plate_text}")
                         continue
 
+                    # Reject strings that don't look like a plate (opt-in:
+                    # the patterns are UK-shaped and would drop valid plates
+                    # from other countries)
+                    if self.config.validate_plate_format and not self._is_valid_plate(plate_text):
+                        logger.debug(f"Frame {i+1}: Rejected invalid plate format: {plate_text}")
+                        continue
+
                     logger.info(f"Frame {i+1}: {plate_text} (confidence: {ocr_confidence:.3f})")
 
                     # Track best result - OCR priority, detection as tiebreaker
@@ -113,43 +663,60 @@ class ALPRProcessor:
                     if is_better:
                         best_confidence = ocr_confidence
                         best_result = result
-                        best_image = img.copy()
+                        best_plate_text = plate_text
 
-                        # Crop plate region
+                        # Keep a reference, not a copy - each decoded frame
+                        # is its own array, so nothing overwrites it.
+                        # Copying a 4K BGR frame costs ~25 MB per improvement.
+                        best_image = img
                         bbox = result.detection.bounding_box
-                        x1, y1 = int(bbox.x1), int(bbox.y1)
-                        x2, y2 = int(bbox.x2), int(bbox.y2)
-                        best_plate_crop = img[y1:y2, x1:x2].copy()
+                        best_bbox = (int(bbox.x1), int(bbox.y1), int(bbox.x2), int(bbox.y2))
 
             except Exception as e:
                 logger.error(f"Error processing frame {i+1}: {e}")
                 continue
 
+            # Early exit - once a plate this confident is in hand, the
+            # remaining frames can't meaningfully improve on it
+            if best_confidence >= self.config.early_exit_confidence:
+                logger.info(
+                    f"Early exit at frame {i+1}: confidence "
+                    f"{best_confidence:.3f} >= {self.config.early_exit_confidence}"
+                )
+                break
+
         # If no detections found, save debug frames
         if not best_result:
             logger.info("No valid plates detected - saving first and last frames for debugging")
-            self._save_debug_frames(frame_bytes_list, save_dir)
+            self._save_debug_frames(frame_bytes_list, save_dir, timestamp)
 
         # Return best result if found
         if best_result and best_image is not None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-            # Save full image
-            image_filename = f"{timestamp}_{best_result.ocr.text.upper().replace(' ', '')}.jpg"
+            # Save full image - encode/write on the writer pool so the
+            # caller isn't blocked on JPEG encoding
+            jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, 85]
+            image_filename = f"{timestamp}_{best_plate_text}.jpg"
             image_path = save_dir / "images" / image_filename
             image_path.parent.mkdir(parents=True, exist_ok=True)
-            cv2.imwrite(str(image_path), best_image)
+            write_futures = [self._io_pool.submit(
+                self._write_image, image_path, best_image, jpeg_params
+            )]
 
-            # Save plate crop
-            crop_filename = f"{timestamp}_{best_result.ocr.text.upper().replace(' ', '')}_crop.jpg"
+            # Save plate crop - extracted once after the loop
+            crop_filename = f"{timestamp}_{best_plate_text}_crop.jpg"
             crop_path = save_dir / "images" / crop_filename
-            if best_plate_crop is not None:
-                cv2.imwrite(str(crop_path), best_plate_crop)
+            if best_bbox is not None:
+                write_futures.append(self._io_pool.submit(
+                    self._write_image, crop_path,
+                    self._crop_plate(best_image, best_bbox), jpeg_params
+                ))
+            for future in write_futures:
+                future.add_done_callback(self._log_write_result)
 
             bbox = best_result.detection.bounding_box
 
             return {
-                'plate_number': best_result.ocr.text.upper().replace(' ', ''),
+                'plate_number': best_plate_text,
                 'confidence': best_result.ocr.confidence,
                 'image_path': f"images/{image_filename}",
                 'plate_crop_path': f"images/{crop_filename}",
@@ -159,47 +726,40 @@ class ALPRProcessor:
                     'xmax': bbox.x2,
                     'ymax': bbox.y2
                 },
-                'frame_count': len(frame_bytes_list)
+                'frame_count': len(frame_bytes_list),
+                # Pending image writes - the caller must wait on these
+                # before publishing image_path/plate_crop_path anywhere
+                # (DB, notifications), or consumers race the encode
+                'write_futures': write_futures
             }
 
         logger.info("No valid plates detected in any frame")
         return None
 
-    def _save_debug_frames(self, frame_bytes_list: List[bytes], save_dir: Path):
-        """Save first and last frames for debugging when no plates detected."""
+    def _save_debug_frames(self, frame_bytes_list: List[bytes], save_dir: Path, timestamp: str):
+        """Save first/middle/last frames for debugging when no plates detected."""
         try:
             debug_dir = save_dir / "debug_frames"
             debug_dir.mkdir(parents=True, exist_ok=True)
 
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-            # Save first frame
+            # Pick sample frames, then decode them in one coalesced call
+            # on the shared decode pool instead of one-by-one
+            samples = []
             if len(frame_bytes_list) > 0:
-                image_array = np.frombuffer(frame_bytes_list[0], np.uint8)
-                img = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-                if img is not None:
-                    first_path = debug_dir / f"{timestamp}_first.jpg"
-                    cv2.imwrite(str(first_path), img)
-                    logger.info(f"Saved first frame: {first_path}")
-
-            # Save last frame
+                samples.append(('first', 0))
             if len(frame_bytes_list) > 1:
-                image_array = np.frombuffer(frame_bytes_list[-1], np.uint8)
-                img = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-                if img is not None:
-                    last_path = debug_dir / f"{timestamp}_last.jpg"
-                    cv2.imwrite(str(last_path), img)
-                    logger.info(f"Saved last frame: {last_path}")
-
-            # Save middle frame
+                samples.append(('last', len(frame_bytes_list) - 1))
             if len(frame_bytes_list) > 2:
-                mid_idx = len(frame_bytes_list) // 2
-                image_array = np.frombuffer(frame_bytes_list[mid_idx], np.uint8)
-                img = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-                if img is not None:
-                    mid_path = debug_dir / f"{timestamp}_middle.jpg"
-                    cv2.imwrite(str(mid_path), img)
-                    logger.info(f"Saved middle frame: {mid_path}")
+                samples.append(('middle', len(frame_bytes_list) // 2))
+
+            images = self._decode_frames([frame_bytes_list[i] for _, i in samples])
+
+            for (label, _), img in zip(samples, images):
+                if img is None:
+                    continue
+                path = debug_dir / f"{timestamp}_{label}.jpg"
+                cv2.imwrite(str(path), img)
+                logger.info(f"Saved {label} frame: {path}")
 
         except Exception as e:
             logger.error(f"Failed to save debug frames: {e}")
@@ -36,6 +36,7 @@ class ANPRService:
         self.notifier = Notifier(self.config)
 
         self.running = False
+        self._stop_event = asyncio.Event()
         self.last_detection_time = 0
         self.detection_cooldown = 30  # seconds - ignore new detections for 30s after starting a recording
 
@@ -50,6 +51,10 @@ class ANPRService:
             await self.database.initialize()
             logger.info("Database initialized")
 
+            # Pre-warm the Telegram connection in the background so the
+            # first detection doesn't pay the TLS handshake
+            asyncio.create_task(self.notifier.warmup())
+
             # Check if config is still default
             if self.config.camera_password == "CHANGE_ME":
                 logger.warning("=" * 60)
@@ -145,7 +150,9 @@ class ANPRService:
             logger.info("✓ ALPR processor reloaded")
             
             # Reload notifier with new settings
+            await self.notifier.aclose()
             self.notifier = Notifier(self.config)
+            asyncio.create_task(self.notifier.warmup())
             logger.info("✓ Notifier reloaded")
             
             # Update logger level if changed
@@ -170,10 +177,17 @@ class ANPRService:
         """Stop the ANPR service gracefully."""
         logger.info("Stopping ANPR Service...")
         self.running = False
+        self._stop_event.set()
 
         # Disconnect from camera
         await self.camera.disconnect()
 
+        # Close the pooled notification session
+        await self.notifier.aclose()
+
+        # Close the long-lived WAL connection
+        await self.database.close()
+
         logger.info("ANPR Service stopped")
 
     async def _wait_for_config(self):
@@ -181,8 +195,8 @@ class ANPRService:
         logger.info("Service running in configuration mode...")
         logger.info("Waiting for configuration via web interface")
 
-        while self.running:
-            await asyncio.sleep(60)
+        # Sleep until stop() is called - no periodic wakeups
+        await self._stop_event.wait()
 
     async def _check_reload_signal(self):
         """Check for reload signal file periodically."""
@@ -204,15 +218,9 @@ class ANPRService:
         logger.info("Monitoring with TCP push events (Baichuan protocol)")
         logger.info("Waiting for vehicle detection events...")
 
-        # Keep alive loop - TCP push events handled by callback
-        while self.running:
-            try:
-                # Just keep the loop alive - events come via TCP push callback
-                await asyncio.sleep(60)  # Wake up every minute to check if still running
-
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(5)
+        # Events come via TCP push callback - just sleep until stop() is
+        # called, instead of waking every minute to re-check a flag
+        await self._stop_event.wait()
 
     async def _handle_vehicle_detection(self):
         """Handle TCP push event - record and process."""
@@ -274,7 +282,7 @@ class ANPRService:
         try:
             # Process frames with ALPR
             save_dir = Path(self.config.database_path).parent
-            result = self.alpr.process_frames(frames, save_dir)
+            result = self.alpr.process_frames_batch(frames, save_dir)
 
             if result:
                 # Valid plate detected
@@ -283,6 +291,18 @@ class ANPRService:
                     f"(confidence: {result['confidence']:.2%})"
                 )
 
+                # Wait for the background image writes before publishing
+                # their paths - the notifier checks isfile once and the
+                # dashboard serves the event immediately, so both race
+                # the JPEG encode otherwise. Failures are already logged
+                # by the processor's done-callback.
+                write_futures = result.pop('write_futures', [])
+                if write_futures:
+                    await asyncio.gather(
+                        *(asyncio.wrap_future(f) for f in write_futures),
+                        return_exceptions=True
+                    )
+
                 # Save to database
                 event_id = await self.database.add_event(result)
                 logger.info(f"Event saved to database (ID: {event_id})")
@@ -329,6 +349,10 @@ async def main():
         raise
     finally:
         await service.stop()
+        # Flush queued log records (including the shutdown messages)
+        # before the process exits
+        from .logger import shutdown_logger
+        shutdown_logger()
 
 
 if __name__ == "__main__":
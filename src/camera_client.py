@@ -1,6 +1,9 @@
 """Reolink camera client with ANPR capabilities."""
 
 import asyncio
+import logging
+import os
+import threading
 import time
 import cv2
 import numpy as np
@@ -10,9 +13,75 @@ from reolink_aio.api import Host
 from .logger import logger
 
 
+class RtspGrabber:
+    """Continuously drain an RTSP capture on a dedicated thread.
+
+    OpenCV's libavformat backend queues frames internally whenever the
+    consumer is slower than the stream, so any stall (JPEG encode, GC)
+    turns into accumulating latency. The grabber thread calls grab() in
+    a tight loop - the demuxer never blocks - and decodes only frames
+    that are due for sampling into a two-slot buffer. The consumer
+    always sees the freshest decoded frame; backlog is bounded to one
+    frame by construction.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture, frame_interval: float):
+        self._cap = cap
+        self._frame_interval = frame_interval
+        self._slots = [None, None]
+        self._active_idx = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="rtsp-grab")
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        next_retrieve = time.monotonic()
+        while not self._stopped.is_set():
+            if not self._cap.grab():
+                break
+            now = time.monotonic()
+            if now < next_retrieve:
+                continue
+            next_retrieve = now + self._frame_interval
+
+            ok, frame = self._cap.retrieve()
+            if not ok:
+                continue
+            inactive = 1 - self._active_idx
+            self._slots[inactive] = frame
+            with self._lock:
+                self._active_idx = inactive
+                self._seq += 1
+
+    def get_latest(self) -> Tuple[int, Optional[np.ndarray]]:
+        """Return (sequence, frame) for the freshest decoded frame."""
+        with self._lock:
+            return self._seq, self._slots[self._active_idx]
+
+
 class CameraClient:
     """Reolink camera client for vehicle detection and ANPR."""
 
+    # Frames per second actually sampled from the stream during a
+    # recording - the detector needs a handful of distinct frames, not
+    # every frame of a 25 fps stream
+    TARGET_SAMPLE_FPS = 5
+
+    # Minimum dHash Hamming distance from the last kept frame - below
+    # this the frame is a near-duplicate and not worth keeping
+    MIN_HASH_DISTANCE = 4
+
+    # Window for coalescing TCP push bursts into one processing attempt
+    MOTION_DEBOUNCE_SECONDS = 0.15
+
     def __init__(self, config):
         self.config = config
         self.host = None
@@ -24,6 +93,19 @@ class CameraClient:
         self.processing_lock = None  # Will be created in connect()
         self.last_processed_time = 0
         self.is_processing = False
+        self._debounce_handle = None  # Pending call_later for motion bursts
+        self._last_isp_key = None  # Fingerprint of last applied ISP settings
+
+        # Invariant request bodies - the channel never changes for the
+        # lifetime of a client, so build these once instead of
+        # allocating the same nested dicts on every camera call
+        self._get_isp_body = [{
+            "cmd": "GetIsp", "action": 1,
+            "param": {"channel": self.config.camera_channel}
+        }]
+        self._get_netport_body = [{
+            "cmd": "GetNetPort", "action": 0, "param": {"channel": 0}
+        }]
 
     async def connect(self) -> bool:
         """Connect to Reolink camera."""
@@ -54,13 +136,13 @@ class CameraClient:
             await self.host.baichuan.subscribe_events()
             logger.info("TCP push events subscribed successfully")
 
-            logger.info(f"Connected to camera at {self.config.camera_host}")
-            logger.info(f"Monitoring: {self.config.camera_name} (Channel {self.config.camera_channel})")
+            logger.info("Connected to camera at %s", self.config.camera_host)
+            logger.info("Monitoring: %s (Channel %s)", self.config.camera_name, self.config.camera_channel)
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to camera: {e}")
+            logger.error("Failed to connect to camera: %s", e)
             return False
 
     def set_processing_callback(self, callback):
@@ -76,26 +158,37 @@ class CameraClient:
             logger.debug("Ignoring initialization TCP push event")
             return
 
-        logger.info(f"TCP push event received - Args: {args}, Kwargs: {kwargs}")
+        logger.info("TCP push event received - Args: %s, Kwargs: %s", args, kwargs)
 
         # Set motion detection flags
         self.motion_detected_flag = True
         self.last_motion_time = current_time
 
-        # Trigger callback for each TCP event (AI state filtering will happen in async task)
-        if self.processing_callback:
+        # Coalesce bursts: busy scenes deliver many pushes in quick
+        # succession, and spawning a task (and an AI-state query) per
+        # push just builds a queue behind the processing lock. A single
+        # deferred slot turns a whole burst into one processing attempt
+        if self.processing_callback and self._debounce_handle is None:
             try:
-                asyncio.create_task(self._check_and_process())
-                logger.debug("Motion event callback triggered")
+                loop = asyncio.get_running_loop()
+                self._debounce_handle = loop.call_later(
+                    self.MOTION_DEBOUNCE_SECONDS, self._fire_motion
+                )
+                logger.debug("Motion event callback scheduled")
             except Exception as e:
-                logger.error(f"Error triggering callback: {e}")
+                logger.error("Error triggering callback: %s", e)
+
+    def _fire_motion(self):
+        """Run one coalesced processing attempt after the debounce window."""
+        self._debounce_handle = None
+        asyncio.create_task(self._check_and_process())
 
     async def _check_and_process(self):
         """Check AI state and process if vehicle detected."""
         try:
             # Check AI state IMMEDIATELY to see if vehicle
             ai_state = await self.host.get_ai_state(self.config.camera_channel)
-            logger.info(f"AI State: {ai_state}")
+            logger.info("AI State: %s", ai_state)
 
             if ai_state and ai_state.get('vehicle') == True:
                 logger.info("VEHICLE motion confirmed via AI state!")
@@ -121,19 +214,23 @@ class CameraClient:
                     if ai_state.get('pet'): motion_types.append('pet')
 
                 if motion_types:
-                    logger.debug(f"Non-vehicle motion ignored: {', '.join(motion_types)}")
+                    logger.debug("Non-vehicle motion ignored: %s", ', '.join(motion_types))
                 else:
                     logger.debug("Motion event but no AI state match")
         except Exception as e:
-            logger.error(f"Error checking AI state: {e}")
+            logger.error("Error checking AI state: %s", e)
 
     async def disconnect(self):
         """Disconnect from camera."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+
         if self.host and self.connected:
             try:
                 await self.host.baichuan.unsubscribe_events()
             except Exception as e:
-                logger.debug(f"Error unsubscribing from events: {e}")
+                logger.debug("Error unsubscribing from events: %s", e)
 
             await self.host.logout()
             self.connected = False
@@ -142,23 +239,42 @@ class CameraClient:
     async def get_isp_settings(self) -> Optional[Dict]:
         """Get current camera ISP settings."""
         try:
-            body = [{"cmd": "GetIsp", "action": 1, "param": {"channel": self.config.camera_channel}}]
-            result = await self.host.send(body)
+            result = await self.host.send(self._get_isp_body)
 
             if result and len(result) > 0 and result[0].get("code") == 0:
                 return result[0].get("value", {}).get("Isp", {})
             return None
 
         except Exception as e:
-            logger.error(f"Failed to get ISP settings: {e}")
+            logger.error("Failed to get ISP settings: %s", e)
             return None
 
+    @staticmethod
+    def _settings_key(value):
+        """Recursively convert a settings structure into a hashable key."""
+        if isinstance(value, dict):
+            return frozenset(
+                (k, CameraClient._settings_key(v)) for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return tuple(CameraClient._settings_key(v) for v in value)
+        return value
+
     async def set_isp_settings(self, settings: Dict) -> bool:
         """Set camera ISP settings."""
         try:
+            # Skip the round trip entirely when these exact settings
+            # were the last ones successfully applied - toggling
+            # between identical profiles otherwise costs SetIsp plus
+            # the verification delay for no state change
+            settings_key = self._settings_key(settings)
+            if settings_key == self._last_isp_key:
+                logger.debug("ISP settings unchanged - skipping camera call")
+                return True
+
             # Log incoming settings request
-            logger.info(f"Requested ISP settings change: {settings}")
-            
+            logger.info("Requested ISP settings change: %s", settings)
+
             # Build the ISP parameter object - ONLY send what we want to change
             isp_data = {
                 "channel": self.config.camera_channel,
@@ -181,26 +297,37 @@ class CameraClient:
             isp_param = {"Isp": isp_data}
             body = [{"cmd": "SetIsp", "action": 0, "param": isp_param}]
             
-            logger.info(f"Sending to camera API: {isp_param}")
+            logger.info("Sending to camera API: %s", isp_param)
             result = await self.host.send(body)
-            logger.info(f"Camera API response: {result}")
+            logger.info("Camera API response: %s", result)
 
             if result and len(result) > 0 and result[0].get("code") == 0:
-                logger.info(f"ISP settings applied successfully")
-                
-                # Verify by reading back
-                await asyncio.sleep(0.5)  # Small delay for camera to apply
-                verify = await self.get_isp_settings()
-                if verify:
-                    logger.info(f"Verified settings after apply - dayNight: {verify.get('dayNight')}, exposure: {verify.get('exposure')}, binningMode: {verify.get('binningMode')}, nr3d: {verify.get('nr3d')}")
-                
+                logger.info("ISP settings applied successfully")
+                self._last_isp_key = settings_key
+
+                # Verify by reading back - debug aid only, so skip the
+                # settle delay and extra GetIsp round trip unless DEBUG
+                # is actually on
+                if logger.isEnabledFor(logging.DEBUG):
+                    await asyncio.sleep(0.5)  # Small delay for camera to apply
+                    verify = await self.get_isp_settings()
+                    if verify:
+                        logger.debug(
+                            "Verified settings after apply - dayNight: %s, exposure: %s, binningMode: %s, nr3d: %s",
+                            verify.get('dayNight'), verify.get('exposure'),
+                            verify.get('binningMode'), verify.get('nr3d')
+                        )
+
                 return True
             else:
-                logger.warning(f"ISP settings may have failed. Response: {result}")
+                logger.warning("ISP settings may have failed. Response: %s", result)
+                # Camera state is now unknown - don't skip the next apply
+                self._last_isp_key = None
                 return False
 
         except Exception as e:
-            logger.error(f"Failed to set ISP settings: {e}")
+            logger.error("Failed to set ISP settings: %s", e)
+            self._last_isp_key = None
             return False
 
     async def apply_recording_settings(self, mode: str) -> bool:
@@ -218,7 +345,7 @@ class CameraClient:
                 return False  # Empty settings
 
             # Log what we're applying
-            logger.debug(f"{mode.capitalize()} settings: {settings}")
+            logger.debug("%s settings: %s", mode.capitalize(), settings)
 
             # Apply settings with single retry
             for attempt in range(2):
@@ -228,48 +355,176 @@ class CameraClient:
                 if attempt == 0:  # Retry once
                     await asyncio.sleep(0.3)
 
-            logger.error(f"❌ Failed to apply {mode}-recording settings")
+            logger.error("❌ Failed to apply %s-recording settings", mode)
             return False
 
         except Exception as e:
-            logger.error(f"Error applying {mode}-recording settings: {e}")
+            logger.error("Error applying %s-recording settings: %s", mode, e)
             return False
 
-    async def _record_rtsp_and_extract_frames(self, duration_seconds: int = 6) -> List[bytes]:
-        """Record RTSP stream for specified duration and extract all frames."""
-        from pathlib import Path
-        import tempfile
-        import os
+    def _rtsp_url(self) -> str:
+        """Construct the RTSP URL (Reolink uses 1-based channel numbering)."""
+        return (
+            f"rtsp://{self.config.camera_username}:{self.config.camera_password}"
+            f"@{self.config.camera_host}:554"
+            f"/h264Preview_{self.config.camera_channel+1:02d}_main"
+        )
+
+    async def _record_rtsp_and_extract_frames(self, duration_seconds: int = 6) -> List[np.ndarray]:
+        """Capture frames from the live RTSP stream for the given duration.
+
+        Opens the stream directly with cv2.VideoCapture and samples
+        TARGET_SAMPLE_FPS frames per second using grab()/retrieve():
+        grab() advances the demuxer without decoding, so the ~80% of
+        frames that aren't sampled never pay H.264 decode or YUV->BGR
+        conversion, and nothing touches the filesystem. Frames are
+        returned as decoded BGR arrays - the ALPR pipeline consumes
+        those directly, so no JPEG encode happens here at all. Falls
+        back to the FFmpeg recording path if the stream can't be opened.
+        """
+        rtsp_url = self._rtsp_url()
+
+        loop = asyncio.get_running_loop()
+        frames = await loop.run_in_executor(
+            None, self._capture_rtsp_frames, rtsp_url, duration_seconds
+        )
+
+        if frames:
+            return frames
 
+        logger.warning("Live RTSP capture failed - falling back to FFmpeg recording")
+        return await self._record_with_ffmpeg(rtsp_url, duration_seconds)
+
+    def _open_capture(self, rtsp_url: str) -> Optional[cv2.VideoCapture]:
+        """Open the RTSP stream, preferring GStreamer over FFmpeg.
+
+        The GStreamer pipeline drops stale frames at the source
+        (max-buffers=1 drop=true sync=false), bounding both memory and
+        latency inside the pipeline itself, and decodebin auto-selects
+        the highest-ranked decoder on the system - vaapi/nvdec hardware
+        elements when present, avdec_h264 software decode otherwise.
+        Builds of OpenCV without GStreamer simply fail to open it and
+        fall through to the FFmpeg backend.
+        """
+        gst_pipeline = (
+            f'rtspsrc location={rtsp_url} latency=0 protocols=tcp ! '
+            'rtph264depay ! h264parse ! decodebin ! videoconvert ! '
+            'video/x-raw,format=BGR ! '
+            'appsink max-buffers=1 drop=true sync=false'
+        )
+        cap = cv2.VideoCapture(gst_pipeline, cv2.CAP_GSTREAMER)
+        if cap.isOpened():
+            logger.info("RTSP capture via GStreamer pipeline")
+            return cap
+        cap.release()
+
+        # Force TCP transport and a small demuxer buffer before the
+        # capture is constructed - these options are read at open time
+        os.environ.setdefault(
+            'OPENCV_FFMPEG_CAPTURE_OPTIONS',
+            'rtsp_transport;tcp|buffer_size;102400'
+        )
+        cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
+        if cap.isOpened():
+            logger.info("RTSP capture via FFmpeg backend")
+            return cap
+        cap.release()
+        return None
+
+    def _capture_rtsp_frames(self, rtsp_url: str, duration_seconds: int) -> List[np.ndarray]:
+        """Blocking live-capture loop (runs on an executor thread)."""
         frames = []
 
+        cap = self._open_capture(rtsp_url)
+        if cap is None:
+            logger.error("Failed to open RTSP stream for live capture")
+            return []
+
+        grabber = None
         try:
-            # Create temporary directory for recording
-            temp_dir = Path(tempfile.gettempdir()) / "reolink_anpr_recordings"
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            frame_interval = 1.0 / self.TARGET_SAMPLE_FPS
+            logger.info(
+                "Live capture: %ss, sampling %s FPS",
+                duration_seconds, self.TARGET_SAMPLE_FPS
+            )
 
-            # Generate temporary file
-            recording_file = temp_dir / f"recording_{int(time.time())}.mp4"
+            # The grabber thread drains the demuxer continuously; this
+            # thread only encodes the freshest frame at the sample rate,
+            # so encode stalls never back up the stream
+            grabber = RtspGrabber(cap, frame_interval)
+            grabber.start()
+
+            deadline = time.monotonic() + duration_seconds
+            last_seq = 0
+            last_hash = None
+            skipped = 0
+            while time.monotonic() < deadline:
+                time.sleep(frame_interval / 2)
+                seq, frame = grabber.get_latest()
+                if frame is None or seq == last_seq:
+                    continue
+                last_seq = seq
+
+                # Perceptual-hash gate: a stationary scene produces runs
+                # of near-identical frames that each cost a full ALPR
+                # pass downstream. dHash on a 17x16 grayscale thumbnail
+                # is ~microseconds; frames within MIN_HASH_DISTANCE bits
+                # of the last kept frame add no new information
+                frame_hash = self._dhash(frame)
+                if last_hash is not None and \
+                        bin(frame_hash ^ last_hash).count('1') < self.MIN_HASH_DISTANCE:
+                    skipped += 1
+                    continue
+                last_hash = frame_hash
+
+                # Each retrieve() produced a fresh array - hand it over
+                # as-is, no JPEG round trip
+                frames.append(frame)
+
+            logger.info(
+                "Live capture complete: %d frames sampled (%d near-duplicates skipped)",
+                len(frames), skipped
+            )
+            return frames
+
+        finally:
+            if grabber is not None:
+                grabber.stop()
+            cap.release()
 
-            # Construct RTSP URL (Reolink uses 1-based channel numbering)
-            rtsp_url = f"rtsp://{self.config.camera_username}:{self.config.camera_password}@{self.config.camera_host}:554/h264Preview_{self.config.camera_channel+1:02d}_main"
+    async def _record_with_ffmpeg(self, rtsp_url: str, duration_seconds: int) -> List[memoryview]:
+        """Stream sampled JPEG frames from FFmpeg's stdout (fallback).
 
-            logger.info(f"Recording RTSP stream for {duration_seconds} seconds...")
+        FFmpeg re-encodes the stream to MJPEG at the sample rate and
+        pipes it to stdout; frames are split on the JPEG SOI/EOI markers.
+        Nothing touches the filesystem - no MP4 mux, no re-open with
+        VideoCapture, no cleanup.
+        """
+        try:
+            logger.info("Recording RTSP stream for %s seconds...", duration_seconds)
 
-            # FFmpeg command to record RTSP stream with input buffer
+            # FFmpeg command tuned for fast RTSP startup: skip input
+            # probing (the first keyframe wait dominated the recording
+            # wall-clock) and drop the audio path entirely
             ffmpeg_cmd = [
                 'ffmpeg',
+                '-fflags', 'nobuffer+genpts',  # No input buffering, generate timestamps
+                '-flags', 'low_delay',
+                '-probesize', '32',  # Stop probing after the first packet
+                '-analyzeduration', '0',
                 '-rtsp_transport', 'tcp',  # Use TCP for more reliable streaming
-                '-fflags', '+genpts',  # Generate presentation timestamps
                 '-i', rtsp_url,
+                '-an',  # No audio - skips the audio demux/remux path
                 '-t', str(duration_seconds),  # Record for specified duration
-                '-c:v', 'copy',  # Copy video codec (no re-encoding)
-                '-c:a', 'copy',  # Copy audio codec
-                '-y',  # Overwrite output file
-                str(recording_file)
+                '-vf', f'fps={self.TARGET_SAMPLE_FPS}',  # Sample down in FFmpeg itself
+                '-c:v', 'mjpeg',
+                '-q:v', '3',
+                '-f', 'image2pipe',
+                '-'
             ]
 
-            # Execute FFmpeg recording
             process = await asyncio.create_subprocess_exec(
                 *ffmpeg_cmd,
                 stdout=asyncio.subprocess.PIPE,
@@ -279,60 +534,61 @@ class CameraClient:
             stdout, stderr = await process.communicate()
 
             if process.returncode != 0:
-                logger.error(f"FFmpeg recording failed (return code {process.returncode})")
-                logger.error(f"FFmpeg stderr: {stderr.decode()}")
-                return []
-
-            # Log FFmpeg output even on success (for debugging)
-            if stderr:
-                logger.debug(f"FFmpeg stderr: {stderr.decode()}")
-
-            if not recording_file.exists():
-                logger.error("Recording file was not created")
-                return []
-
-            logger.info(f"Recording complete: {recording_file.stat().st_size} bytes")
-
-            # Extract all frames from recording
-            logger.info("Extracting frames from recording...")
-
-            cap = cv2.VideoCapture(str(recording_file))
-
-            if not cap.isOpened():
-                logger.error(f"Failed to open recorded video file")
+                logger.error("FFmpeg recording failed (return code %s)", process.returncode)
+                logger.error("FFmpeg stderr: %s", stderr.decode())
                 return []
 
-            # Get video properties
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            logger.info(f"Video info: {fps:.1f} FPS, {total_frames} total frames")
-
-            frame_count = 0
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Convert frame to JPEG bytes
-                _, buffer = cv2.imencode('.jpg', frame)
-                frames.append(buffer.tobytes())
-                frame_count += 1
-
-            cap.release()
+            # Log FFmpeg output even on success (for debugging) - the
+            # decode of a multi-kilobyte stderr buffer is only worth
+            # paying when DEBUG actually dispatches
+            if stderr and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg stderr: %s", stderr.decode())
 
-            # Clean up recording file
-            try:
-                recording_file.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to clean up recording file: {e}")
-
-            logger.info(f"Extracted {len(frames)} frames from {duration_seconds}s recording")
+            frames = self._split_mjpeg_stream(stdout)
+            logger.info("Extracted %d frames from %ss recording", len(frames), duration_seconds)
             return frames
 
         except Exception as e:
-            logger.error(f"Error recording RTSP stream: {e}")
+            logger.error("Error recording RTSP stream: %s", e)
             return []
 
+    @staticmethod
+    def _dhash(frame: np.ndarray) -> int:
+        """Compute a 256-bit difference hash of a frame.
+
+        Resizes to a 17x16 grayscale thumbnail and compares each pixel
+        to its horizontal neighbour; the resulting bit pattern is stable
+        under noise and compression but shifts when the scene actually
+        changes (a vehicle entering the frame).
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, (17, 16), interpolation=cv2.INTER_AREA)
+        bits = thumb[:, 1:] > thumb[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+    @staticmethod
+    def _split_mjpeg_stream(data: bytes) -> List[memoryview]:
+        """Split an MJPEG byte stream into individual JPEG frames.
+
+        Returns zero-copy memoryview slices over the stdout buffer - a
+        bytes slice per frame would duplicate the whole recording on
+        the heap, and the decode path (np.frombuffer) takes any buffer
+        object as-is.
+        """
+        view = memoryview(data)
+        frames = []
+        pos = 0
+        while True:
+            soi = data.find(b'\xff\xd8', pos)
+            if soi < 0:
+                break
+            eoi = data.find(b'\xff\xd9', soi + 2)
+            if eoi < 0:
+                break
+            frames.append(view[soi:eoi + 2])
+            pos = eoi + 2
+        return frames
+
     async def get_snapshot(self) -> Optional[bytes]:
         """Get a single snapshot from the camera."""
         try:
@@ -342,7 +598,7 @@ class CameraClient:
             )
             return snapshot
         except Exception as e:
-            logger.error(f"Error getting snapshot: {e}")
+            logger.error("Error getting snapshot: %s", e)
             return None
 
     async def get_device_info(self) -> Dict:
@@ -355,15 +611,14 @@ class CameraClient:
                 'connected': self.connected
             }
         except Exception as e:
-            logger.error(f"Error getting device info: {e}")
+            logger.error("Error getting device info: %s", e)
             return {}
     
     async def _ensure_rtsp_enabled(self):
         """Check and enable RTSP if it's disabled."""
         try:
             # Get current network port settings
-            body = [{"cmd": "GetNetPort", "action": 0, "param": {"channel": 0}}]
-            response = await self.host.send(body)
+            response = await self.host.send(self._get_netport_body)
             
             if response and len(response) > 0:
                 net_port = response[0].get("value", {}).get("NetPort", {})
@@ -390,9 +645,9 @@ class CameraClient:
                     if enable_response and enable_response[0].get("code") == 0:
                         logger.info("✅ RTSP enabled successfully on port 554")
                     else:
-                        logger.error(f"Failed to enable RTSP: {enable_response}")
+                        logger.error("Failed to enable RTSP: %s", enable_response)
                 else:
-                    logger.info(f"✅ RTSP already enabled on port {rtsp_port}")
+                    logger.info("✅ RTSP already enabled on port %s", rtsp_port)
                     
         except Exception as e:
-            logger.warning(f"Could not check/enable RTSP (camera may not support API): {e}")
+            logger.warning("Could not check/enable RTSP (camera may not support API): %s", e)
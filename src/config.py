@@ -11,6 +11,7 @@ class Config:
         self.config_path = Path(config_path)
         self._config = self._load_config()
         # Don't validate - allow web config to set everything
+        self._flatten()
 
     def _create_default_config(self):
         """Create default configuration file."""
@@ -61,82 +62,49 @@ class Config:
                 return None
         return value
 
-    # Camera settings
-    @property
-    def camera_host(self) -> str:
-        return self.get('camera', 'host')
-
-    @property
-    def camera_username(self) -> str:
-        return self.get('camera', 'username')
-
-    @property
-    def camera_password(self) -> str:
-        return self.get('camera', 'password')
-
-    @property
-    def camera_channel(self) -> int:
-        return self.get('camera', 'channel')
-
-    @property
-    def camera_name(self) -> str:
-        return self.get('camera', 'name')
-
-    # Recording settings (from camera section)
-    @property
-    def recording_duration(self) -> int:
-        return self.get('camera', 'recording_duration') or 6
-
-    # ALPR settings
-    @property
-    def detector_model(self) -> str:
-        return self.get('alpr', 'detection_model') or 'yolo-v9-t-640-license-plate-end2end'
-
-    @property
-    def ocr_model(self) -> str:
-        return self.get('alpr', 'ocr_model') or 'cct-s-v1-global-model'
-
-    @property
-    def min_confidence(self) -> float:
-        return self.get('alpr', 'min_confidence') or 0.9
-
-    # System settings
-    @property
-    def database_path(self) -> str:
-        return self.get('system', 'database_path') or 'data/anpr.db'
-
-    @property
-    def web_host(self) -> str:
-        return self.get('system', 'web_host') or '0.0.0.0'
-
-    @property
-    def web_port(self) -> int:
-        return self.get('system', 'web_port') or 5001
-
-    @property
-    def log_level(self) -> str:
-        return self.get('system', 'log_level') or 'INFO'
-
-    @property
-    def log_file(self) -> str:
-        return self.get('system', 'log_file') or 'logs/anpr.log'
-
-    # Recording settings (optional)
-    @property
-    def before_recording_enabled(self) -> bool:
-        return self.get('recording', 'before_recording_enabled') or False
-
-    @property
-    def before_recording_settings(self) -> dict:
-        return self.get('recording', 'before_recording_settings') or {}
-
-    @property
-    def after_recording_enabled(self) -> bool:
-        return self.get('recording', 'after_recording_enabled') or False
-
-    @property
-    def after_recording_settings(self) -> dict:
-        return self.get('recording', 'after_recording_settings') or {}
+    def _flatten(self):
+        """Populate flat attributes from the parsed config.
+
+        Values like camera_channel are read on every motion event; plain
+        attributes make those reads a single lookup instead of a property
+        call walking nested dicts each time. Config instances are rebuilt
+        on reload, so the attributes can't go stale.
+        """
+        # Camera settings
+        self.camera_host = self.get('camera', 'host')
+        self.camera_username = self.get('camera', 'username')
+        self.camera_password = self.get('camera', 'password')
+        self.camera_channel = self.get('camera', 'channel')
+        self.camera_name = self.get('camera', 'name')
+
+        # Recording settings (from camera section)
+        self.recording_duration = self.get('camera', 'recording_duration') or 6
+
+        # ALPR settings
+        self.detector_model = self.get('alpr', 'detection_model') or 'yolo-v9-t-640-license-plate-end2end'
+        self.ocr_model = self.get('alpr', 'ocr_model') or 'cct-s-v1-global-model'
+        self.min_confidence = self.get('alpr', 'min_confidence') or 0.9
+        # Model precision: fp32 (default), fp16 (GPU) or int8 (CPU)
+        self.alpr_precision = self.get('alpr', 'precision') or 'fp32'
+        # Stop scanning frames once a plate reaches this OCR confidence
+        self.early_exit_confidence = self.get('alpr', 'early_exit_confidence') or 0.95
+        # Reject OCR strings that don't match known plate formats (UK-style;
+        # off by default since the global OCR model reads plates from many
+        # countries these patterns would reject)
+        self.validate_plate_format = bool(self.get('alpr', 'validate_plate_format'))
+
+        # System settings
+        self.database_path = self.get('system', 'database_path') or 'data/anpr.db'
+        self.web_host = self.get('system', 'web_host') or '0.0.0.0'
+        self.web_port = self.get('system', 'web_port') or 5001
+        self.log_level = self.get('system', 'log_level') or 'INFO'
+        self.log_file = self.get('system', 'log_file') or 'logs/anpr.log'
+
+        # Recording settings (optional)
+        self.before_recording_enabled = self.get('recording', 'before_recording_enabled') or False
+        self.before_recording_settings = self.get('recording', 'before_recording_settings') or {}
+        self.after_recording_enabled = self.get('recording', 'after_recording_enabled') or False
+        self.after_recording_settings = self.get('recording', 'after_recording_settings') or {}
 
     def ensure_directories(self):
         """Create required directories if they don't exist."""
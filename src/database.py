@@ -1,9 +1,19 @@
 """Database operations for ReolinkANPR."""
 
+import asyncio
 import aiosqlite
 import json
 from pathlib import Path
-from datetime import datetime
+
+# orjson is faster than stdlib json and serializes numpy scalars
+# natively (YOLO box coords arrive as np.float32) - fall back to the
+# stdlib if it isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from typing import Dict, List, Optional
 from src.logger import logger
 
@@ -14,6 +24,32 @@ class Database:
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._fts_enabled = False
+
+    async def _connection(self) -> aiosqlite.Connection:
+        """Get the long-lived connection, opening it on first use.
+
+        A fresh connect() per call paid connection setup and a cold page
+        cache on every query. One WAL-mode connection is kept for the
+        lifetime of the process: WAL reads don't block the writer, and
+        writes are serialized through _write_lock.
+        """
+        if self._db is None:
+            self._db = await aiosqlite.connect(self.db_path)
+            self._db.row_factory = aiosqlite.Row
+            await self._db.execute('PRAGMA journal_mode=WAL')
+            await self._db.execute('PRAGMA synchronous=NORMAL')
+            await self._db.execute('PRAGMA temp_store=MEMORY')
+            await self._db.execute('PRAGMA mmap_size=268435456')
+        return self._db
+
+    async def close(self):
+        """Close the long-lived connection."""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
 
     async def initialize(self):
         """Create database tables if they don't exist."""
@@ -44,60 +80,180 @@ class Database:
                 ON events(plate_number)
             ''')
 
+            # Composite index so the dedup probe is an index seek
+            await db.execute('''
+                CREATE INDEX IF NOT EXISTS idx_plate_ts
+                ON events(plate_number, timestamp DESC)
+            ''')
+
+            await self._initialize_fts(db)
+
             await db.commit()
 
+    async def _initialize_fts(self, db):
+        """Set up the FTS5 trigram mirror of plate_number, if supported.
+
+        LIKE '%xxx%' can't use idx_plate_number, so plate search was a
+        full table scan. A trigram-tokenized FTS5 table turns substring
+        search into an index seek; triggers keep it in sync with events.
+        Requires SQLite 3.34+ - older builds silently keep the LIKE path.
+        """
+        try:
+            cursor = await db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='events_fts'"
+            )
+            already_exists = await cursor.fetchone() is not None
+
+            await db.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+                    plate_number,
+                    content='events',
+                    content_rowid='id',
+                    tokenize='trigram'
+                )
+            ''')
+            await db.execute('''
+                CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+                    INSERT INTO events_fts(rowid, plate_number)
+                    VALUES (new.id, new.plate_number);
+                END
+            ''')
+            await db.execute('''
+                CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+                    INSERT INTO events_fts(events_fts, rowid, plate_number)
+                    VALUES ('delete', old.id, old.plate_number);
+                END
+            ''')
+            await db.execute('''
+                CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE ON events BEGIN
+                    INSERT INTO events_fts(events_fts, rowid, plate_number)
+                    VALUES ('delete', old.id, old.plate_number);
+                    INSERT INTO events_fts(rowid, plate_number)
+                    VALUES (new.id, new.plate_number);
+                END
+            ''')
+
+            if not already_exists:
+                # Backfill the index from existing events
+                await db.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+            self._fts_enabled = True
+
+        except aiosqlite.OperationalError as e:
+            logger.warning("FTS5 trigram search unavailable, using LIKE: %s", e)
+            self._fts_enabled = False
+
+    @staticmethod
+    def _dump_coordinates(coords) -> str:
+        """Serialize box coordinates for storage.
+
+        OPT_SERIALIZE_NUMPY handles np.float32 coords that stdlib json
+        would reject without a custom encoder. Decoded to str so the
+        column stays TEXT and rows jsonify cleanly in the web API.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                coords or {}, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        return json.dumps(coords or {})
+
     async def add_event(self, event_data: Dict) -> int:
         """Add a new ANPR event to database with deduplication."""
-        async with aiosqlite.connect(self.db_path) as db:
-            plate_number = event_data.get('plate_number')
-            
-            # Check for duplicate within last 30 seconds
-            cursor = await db.execute('''
-                SELECT id, timestamp FROM events
-                WHERE plate_number = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            ''', (plate_number,))
-            
-            last_event = await cursor.fetchone()
-            
-            if last_event:
-                # Parse timestamp and check if within 30 seconds
-                last_time = datetime.fromisoformat(last_event[1])
-                time_diff = (datetime.now() - last_time).total_seconds()
-                
-                if time_diff < 30:
-                    logger.info(f"Duplicate plate {plate_number} detected within 30s - skipping")
-                    return last_event[0]  # Return existing event ID
-            
-            # No duplicate found - insert new event
+        db = await self._connection()
+        plate_number = event_data.get('plate_number')
+
+        async with self._write_lock:
+            # Single atomic statement: insert unless the same plate was
+            # already recorded in the last 30 seconds. SQLite evaluates
+            # the window itself (timestamps are stored in UTC), so
+            # there's no SELECT roundtrip or Python datetime parsing,
+            # and the check is atomic with respect to concurrent writers
             cursor = await db.execute('''
                 INSERT INTO events
                 (plate_number, confidence, image_path, plate_crop_path,
                  box_coordinates, frame_count)
-                VALUES (?, ?, ?, ?, ?, ?)
+                SELECT ?, ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM events
+                    WHERE plate_number = ?
+                      AND timestamp > datetime('now', '-30 seconds')
+                )
             ''', (
                 plate_number,
                 event_data.get('confidence'),
                 event_data.get('image_path'),
                 event_data.get('plate_crop_path'),
-                json.dumps(event_data.get('box_coordinates', {})),
-                event_data.get('frame_count', 1)
+                self._dump_coordinates(event_data.get('box_coordinates')),
+                event_data.get('frame_count', 1),
+                plate_number
             ))
             await db.commit()
-            return cursor.lastrowid
 
-    async def get_recent_events(self, limit: int = 50) -> List[Dict]:
-        """Get recent ANPR events."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+            if cursor.rowcount:
+                return cursor.lastrowid
+
+            # Duplicate suppressed - fetch the existing event ID
+            logger.info("Duplicate plate %s detected within 30s - skipping", plate_number)
             cursor = await db.execute('''
-                SELECT * FROM events
+                SELECT id FROM events
+                WHERE plate_number = ?
                 ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (limit,))
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+                LIMIT 1
+            ''', (plate_number,))
+            row = await cursor.fetchone()
+            return row[0] if row else 0
+
+    async def add_events(self, events: List[Dict]) -> int:
+        """Add a batch of ANPR events under a single transaction.
+
+        A burst of OCR hits otherwise pays one WAL commit (and fsync)
+        per event; executemany runs the same deduplicating insert for
+        every row and commits once. Rows execute in order, so the
+        30-second window also deduplicates within the batch itself.
+        Returns the number of rows actually inserted.
+        """
+        if not events:
+            return 0
+
+        rows = [
+            (
+                event.get('plate_number'),
+                event.get('confidence'),
+                event.get('image_path'),
+                event.get('plate_crop_path'),
+                self._dump_coordinates(event.get('box_coordinates')),
+                event.get('frame_count', 1),
+                event.get('plate_number'),
+            )
+            for event in events
+        ]
+
+        db = await self._connection()
+        async with self._write_lock:
+            cursor = await db.executemany('''
+                INSERT INTO events
+                (plate_number, confidence, image_path, plate_crop_path,
+                 box_coordinates, frame_count)
+                SELECT ?, ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM events
+                    WHERE plate_number = ?
+                      AND timestamp > datetime('now', '-30 seconds')
+                )
+            ''', rows)
+            await db.commit()
+            return cursor.rowcount
+
+    async def get_recent_events(self, limit: int = 50) -> List[Dict]:
+        """Get recent ANPR events."""
+        db = await self._connection()
+        cursor = await db.execute('''
+            SELECT * FROM events
+            ORDER BY timestamp DESC
+            LIMIT ?
+        ''', (limit,))
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
 
     async def get_paginated_events(
         self,
@@ -109,39 +265,51 @@ class Database:
         """Get paginated events with optional search and filter."""
         where_clause, params = self._build_where_clause(search, filter_type)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        db = await self._connection()
 
-            # Get total count
-            count_query = f'SELECT COUNT(*) as count FROM events {where_clause}'
-            cursor = await db.execute(count_query, params)
-            row = await cursor.fetchone()
-            total = row['count']
+        # One pass: the window function computes the total over the same
+        # filtered set, so the predicate isn't evaluated twice
+        query = f'''
+            SELECT *, COUNT(*) OVER () AS total_count FROM events
+            {where_clause}
+            ORDER BY timestamp DESC
+            LIMIT ? OFFSET ?
+        '''
+        cursor = await db.execute(query, params + [limit, offset])
+        rows = await cursor.fetchall()
 
-            # Get paginated results
-            query = f'''
-                SELECT * FROM events
-                {where_clause}
-                ORDER BY timestamp DESC
-                LIMIT ? OFFSET ?
-            '''
-            params.extend([limit, offset])
-            cursor = await db.execute(query, params)
-            rows = await cursor.fetchall()
+        if rows:
+            total = rows[0]['total_count']
             events = [dict(row) for row in rows]
-
+            for event in events:
+                del event['total_count']
             return events, total
 
+        # Page beyond the end (or no matches) - only then count separately
+        count_query = f'SELECT COUNT(*) AS count FROM events {where_clause}'
+        cursor = await db.execute(count_query, params)
+        row = await cursor.fetchone()
+        return [], row['count']
+
     def _build_where_clause(self, search: str = '', filter_type: str = 'all') -> tuple[str, list]:
         """Build WHERE clause for search and filter."""
         conditions = []
         params = []
 
-        # Search condition
+        # Search condition - FTS5 trigram seek when available (trigram
+        # tokens need at least 3 characters), LIKE scan otherwise
         if search:
-            search_term = f'%{search}%'
-            conditions.append('plate_number LIKE ?')
-            params.append(search_term)
+            if self._fts_enabled and len(search) >= 3:
+                conditions.append(
+                    'id IN (SELECT rowid FROM events_fts WHERE plate_number MATCH ?)'
+                )
+                # Doubling embedded quotes keeps the MATCH argument a
+                # single phrase - a bare " in user input is otherwise an
+                # fts5 syntax error
+                params.append('"{}"'.format(search.replace('"', '""')))
+            else:
+                conditions.append('plate_number LIKE ?')
+                params.append(f'%{search}%')
 
         # Date filter
         if filter_type == 'today':
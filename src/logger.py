@@ -1,11 +1,26 @@
 """Logging configuration for ReolinkANPR."""
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# The active QueueListener - kept so reloads can stop the old drain
+# thread and shutdown can flush pending records
+_listener: QueueListener = None
+
+
 def setup_logger(name: str = "ReolinkANPR", log_file: str = None, level: str = "INFO"):
-    """Setup and configure logger."""
+    """Setup and configure logger.
+
+    Handlers sit behind a QueueHandler: log calls just enqueue the
+    record, and a background QueueListener thread does the actual
+    console/file writes. Without this every logger.info() performed a
+    synchronous disk write on the event-loop thread, which stalled the
+    reactor during motion storms.
+    """
+    global _listener
 
     # Create logger
     logger = logging.getLogger(name)
@@ -13,6 +28,9 @@ def setup_logger(name: str = "ReolinkANPR", log_file: str = None, level: str = "
 
     # Remove all existing handlers to prevent duplicates on reload
     logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
     # Create formatters
     formatter = logging.Formatter(
@@ -23,16 +41,33 @@ def setup_logger(name: str = "ReolinkANPR", log_file: str = None, level: str = "
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
-    # File handler (if log file specified)
+    # File handler (if log file specified) - rotating, so disk usage
+    # stays bounded on long-running installs
     if log_file:
         Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10_000_000, backupCount=5
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
+
+def shutdown_logger():
+    """Stop the listener thread, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # Default logger instance
 logger = setup_logger()
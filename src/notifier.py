@@ -1,24 +1,85 @@
 """Simple notification service for Home Assistant and Telegram."""
 
+import asyncio
+import time
 import aiohttp
+import cv2
+from collections import OrderedDict
+from os.path import isfile
 from typing import Optional
 from pathlib import Path
 from src.logger import logger
 
+__all__ = ['Notifier']
+
+
+class TokenBucket:
+    """Simple token-bucket limiter for shaping outbound requests.
+
+    Tokens refill at `rate` per second up to `capacity`; acquire()
+    sleeps just long enough for the next token when the bucket is dry.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
 
 class Notifier:
     """Handle notifications to Home Assistant and Telegram."""
 
+    # The config summary is the same for every instance built from the
+    # same config; log it once per process, not on every test click
+    _logged_config = False
+
     def __init__(self, config):
         self.config = config
         self.enabled = False
         self.ha_enabled = False
         self.telegram_enabled = False
-        
+        self._tg_session: Optional[aiohttp.ClientSession] = None
+        self._ha_session: Optional[aiohttp.ClientSession] = None
+        self._pending: set = set()  # Detached send tasks, kept alive here
+
+        # Coalescing queue for Telegram sends - created lazily with the
+        # drain task on first detection
+        self._batch_q: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
+        # Shape outbound Telegram traffic below the API's global cap
+        # (~30 msg/s) so bursts don't trigger 429 storms; the semaphore
+        # bounds in-flight uploads, the bucket bounds the send rate
+        self._tg_sem = asyncio.Semaphore(5)
+        self._tg_bucket = TokenBucket(rate=25, capacity=30)
+
+        # Plate -> monotonic time of last notification, LRU-ordered.
+        # A car sitting in frame re-triggers the same plate repeatedly;
+        # suppress repeats inside the dedup window
+        self._recent: OrderedDict = OrderedDict()
+        self._dedup_window = 60
+        self._recent_max = 512
+
+
         # Load settings
         if hasattr(config, '_config') and 'notifications' in config._config:
             notif_config = config._config['notifications']
             self.enabled = notif_config.get('enabled', False)
+            self._dedup_window = notif_config.get('dedup_seconds', 60)
             
             # Home Assistant
             ha_config = notif_config.get('home_assistant', {})
@@ -31,16 +92,133 @@ class Notifier:
             self.telegram_token = tg_config.get('bot_token', '')
             self.telegram_chat_id = tg_config.get('chat_id', '')
             
-            logger.info(f"Notifications: enabled={self.enabled}, telegram={self.telegram_enabled}, ha={self.ha_enabled}")
-            if self.enabled:
-                logger.info("✓ Notifications enabled")
-                if self.ha_enabled:
-                    logger.info("  ✓ Home Assistant webhook configured")
-                if self.telegram_enabled:
-                    logger.info(f"  ✓ Telegram bot configured (chat_id: {self.telegram_chat_id})")
-        else:
+            if not Notifier._logged_config:
+                Notifier._logged_config = True
+                logger.info(f"Notifications: enabled={self.enabled}, telegram={self.telegram_enabled}, ha={self.ha_enabled}")
+                if self.enabled:
+                    logger.info("✓ Notifications enabled")
+                    if self.ha_enabled:
+                        logger.info("  ✓ Home Assistant webhook configured")
+                    if self.telegram_enabled:
+                        logger.info(f"  ✓ Telegram bot configured (chat_id: {self.telegram_chat_id})")
+        elif not Notifier._logged_config:
+            Notifier._logged_config = True
             logger.info("Notifications: not configured")
 
+    def _get_tg_session(self) -> aiohttp.ClientSession:
+        """Get the shared Telegram session, creating it on first use.
+
+        A fresh ClientSession per notification paid TCP + TLS handshake
+        every time; a lazily-created session reuses pooled keepalive
+        connections across detections. Telegram gets its own pool so a
+        slow Home Assistant webhook can never hold up a Telegram send,
+        and base_url skips per-call URL parsing.
+        """
+        if self._tg_session is None or self._tg_session.closed:
+            self._tg_session = aiohttp.ClientSession(
+                base_url="https://api.telegram.org",
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75
+                )
+            )
+        return self._tg_session
+
+    def _get_ha_session(self) -> aiohttp.ClientSession:
+        """Get the shared Home Assistant session, creating it on first use."""
+        if self._ha_session is None or self._ha_session.closed:
+            self._ha_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._ha_session
+
+    async def warmup(self):
+        """Pre-warm the Telegram connection with a getMe call.
+
+        The first real notification otherwise pays DNS plus the full
+        TLS handshake before the message even leaves. Errors are
+        swallowed - this is purely opportunistic.
+        """
+        if not (self.telegram_enabled and self.telegram_token):
+            return
+        try:
+            session = self._get_tg_session()
+            async with session.get(f"/bot{self.telegram_token}/getMe", timeout=5) as response:
+                logger.debug(f"Telegram warmup status: {response.status}")
+        except Exception as e:
+            logger.debug(f"Telegram warmup failed: {e}")
+
+    async def aclose(self):
+        """Stop the batch worker and close the shared HTTP sessions."""
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            self._batch_task = None
+            self._batch_q = None
+        for session in (self._tg_session, self._ha_session):
+            if session is not None and not session.closed:
+                await session.close()
+        self._tg_session = None
+        self._ha_session = None
+
+    def _enqueue_telegram(self, plate_number: str, confidence: float, image_path: Optional[str]):
+        """Queue a detection for the coalescing Telegram worker."""
+        if self._batch_q is None:
+            self._batch_q = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._drain_telegram_queue())
+        self._batch_q.put_nowait((plate_number, confidence, image_path))
+
+    async def _drain_telegram_queue(self):
+        """Coalesce queued detections into single Telegram messages.
+
+        A rush of plates within one drain cycle becomes one "N plates
+        detected" message (with the first available photo) instead of N
+        separate uploads - fewer API calls and no burst against the
+        rate limiter. The short sleep after each send sets the
+        coalescing window.
+        """
+        while True:
+            items = [await self._batch_q.get()]
+            try:
+                while True:
+                    items.append(self._batch_q.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+
+            if len(items) == 1:
+                plate_number, confidence, image_path = items[0]
+                message = f"🚗 Plate Detected: {plate_number} ({confidence:.1%} confidence)"
+                await self._send_to_telegram(message, image_path)
+            else:
+                lines = [f"🚗 {len(items)} plates detected:"]
+                lines += [
+                    f"  {plate} ({conf:.1%} confidence)"
+                    for plate, conf, _ in items
+                ]
+                image_path = next((path for _, _, path in items if path), None)
+                await self._send_to_telegram('\n'.join(lines), image_path)
+
+            await asyncio.sleep(0.5)
+
+    def _is_duplicate(self, plate_number: str) -> bool:
+        """Record this plate and report whether it was notified recently.
+
+        LRU with a TTL: entries move to the end on hit, and the oldest
+        are evicted past _recent_max so the cache stays bounded even
+        with a steady stream of distinct plates.
+        """
+        now = time.monotonic()
+        last = self._recent.get(plate_number)
+        if last is not None and now - last < self._dedup_window:
+            return True
+        self._recent[plate_number] = now
+        self._recent.move_to_end(plate_number)
+        while len(self._recent) > self._recent_max:
+            self._recent.popitem(last=False)
+        return False
+
     async def send_detection(self, plate_number: str, confidence: float, image_path: Optional[str] = None):
         """Send notification when a plate is detected."""
         logger.debug(f"send_detection called: enabled={self.enabled}, plate={plate_number}")
@@ -48,74 +226,156 @@ class Notifier:
         if not self.enabled:
             logger.debug("Notifications disabled - skipping")
             return
-        
-        message = f"🚗 Plate Detected: {plate_number} ({confidence:.1%} confidence)"
-        
-        # Send to Home Assistant
+
+        if self._is_duplicate(plate_number):
+            logger.debug(f"Duplicate notification for {plate_number} suppressed")
+            return
+
+        # Dispatch to both services concurrently - a slow HA webhook
+        # shouldn't delay the Telegram send (or vice versa). Both
+        # senders catch their own exceptions, but return_exceptions
+        # keeps one failure from cancelling the other regardless
+        sends = []
         if self.ha_enabled and self.ha_webhook:
             logger.debug("Sending to Home Assistant...")
-            await self._send_to_home_assistant(plate_number, confidence, image_path)
-        
-        # Send to Telegram
+            sends.append(self._send_to_home_assistant(plate_number, confidence, image_path))
+
         if self.telegram_enabled and self.telegram_token and self.telegram_chat_id:
-            logger.debug("Sending to Telegram...")
-            await self._send_to_telegram(message, image_path)
-        
+            logger.debug("Queueing Telegram send...")
+            self._enqueue_telegram(plate_number, confidence, image_path)
+
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
+
         if not self.ha_enabled and not self.telegram_enabled:
             logger.warning("Notifications enabled but no services configured!")
 
+    def send_detection_nowait(self, plate_number: str, confidence: float, image_path: Optional[str] = None):
+        """Fire-and-forget variant of send_detection.
+
+        Detaches the send as a background task so the detection
+        pipeline never blocks on notification I/O. The task is held in
+        _pending until done (loops only keep weak references to tasks).
+        """
+        task = asyncio.create_task(
+            self.send_detection(plate_number, confidence, image_path)
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
     async def _send_to_home_assistant(self, plate_number: str, confidence: float, image_path: Optional[str]):
         """Send webhook to Home Assistant."""
         try:
-            async with aiohttp.ClientSession() as session:
-                data = {
-                    'plate_number': plate_number,
-                    'confidence': confidence,
-                    'image_path': image_path
-                }
-                async with session.post(self.ha_webhook, json=data, timeout=5) as response:
-                    if response.status == 200:
-                        logger.info(f"Sent to Home Assistant: {plate_number}")
-                    else:
-                        logger.warning(f"Home Assistant returned status {response.status}")
+            session = self._get_ha_session()
+            data = {
+                'plate_number': plate_number,
+                'confidence': confidence,
+                'image_path': image_path
+            }
+            async with session.post(self.ha_webhook, json=data, timeout=5) as response:
+                if response.status == 200:
+                    logger.info(f"Sent to Home Assistant: {plate_number}")
+                else:
+                    logger.warning(f"Home Assistant returned status {response.status}")
         except Exception as e:
             logger.error(f"Failed to send to Home Assistant: {e}")
 
+    # Telegram displays photos at 1280px anyway, so shrinking a
+    # 2560x1440 snapshot before upload cuts bytes on the wire several
+    # times over without visible loss
+    MAX_PHOTO_DIM = 1280
+    PHOTO_JPEG_QUALITY = 80
+
+    def _prepare_photo(self, image_path: str) -> bytes:
+        """Load and shrink a detection image for upload (blocking).
+
+        Runs on a worker thread. Falls back to the raw file bytes if
+        the image can't be decoded.
+        """
+        img = cv2.imread(image_path)
+        if img is None:
+            return Path(image_path).read_bytes()
+
+        h, w = img.shape[:2]
+        scale = self.MAX_PHOTO_DIM / max(h, w)
+        if scale < 1.0:
+            img = cv2.resize(
+                img, (int(w * scale), int(h * scale)),
+                interpolation=cv2.INTER_AREA
+            )
+
+        ok, encoded = cv2.imencode(
+            '.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, self.PHOTO_JPEG_QUALITY]
+        )
+        if not ok:
+            return Path(image_path).read_bytes()
+        return encoded.tobytes()
+
+    async def _post_telegram(self, url: str, make_kwargs, success_msg: str):
+        """POST to the Telegram API under the rate limiter.
+
+        make_kwargs is a callable rebuilding the request kwargs - form
+        payloads are consumed on send, so a 429 retry needs a fresh
+        one. On 429 the API's retry_after is honoured once.
+        """
+        session = self._get_tg_session()
+        async with self._tg_sem:
+            for attempt in range(2):
+                await self._tg_bucket.acquire()
+                async with session.post(url, **make_kwargs()) as response:
+                    if response.status == 200:
+                        logger.info(success_msg)
+                        return
+                    response_text = await response.text()
+                    if response.status == 429 and attempt == 0:
+                        try:
+                            retry_after = (await response.json())['parameters']['retry_after']
+                        except Exception:
+                            retry_after = 1
+                        logger.warning(f"Telegram rate limited - retrying in {retry_after}s")
+                        await asyncio.sleep(retry_after)
+                        continue
+                    logger.warning(f"Telegram returned status {response.status}: {response_text}")
+                    return
+
     async def _send_to_telegram(self, message: str, image_path: Optional[str]):
         """Send message to Telegram with optional image."""
         try:
-            async with aiohttp.ClientSession() as session:
-                # If we have an image, send as photo with caption
-                if image_path and Path(image_path).exists():
-                    url = f"https://api.telegram.org/bot{self.telegram_token}/sendPhoto"
-                    
-                    # Read image file
-                    with open(image_path, 'rb') as img_file:
-                        form = aiohttp.FormData()
-                        form.add_field('chat_id', self.telegram_chat_id)
-                        form.add_field('caption', message, content_type='text/plain')
-                        form.add_field('photo', img_file, filename='detection.jpg', content_type='image/jpeg')
-                        
-                        async with session.post(url, data=form, timeout=30) as response:
-                            if response.status == 200:
-                                logger.info(f"Sent photo to Telegram: {message}")
-                            else:
-                                response_text = await response.text()
-                                logger.warning(f"Telegram photo returned status {response.status}: {response_text}")
-                else:
-                    # No image or image doesn't exist - send text only
-                    url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-                    data = {
-                        'chat_id': self.telegram_chat_id,
-                        'text': message,
-                        'parse_mode': 'HTML'
-                    }
-                    async with session.post(url, json=data, timeout=10) as response:
-                        if response.status == 200:
-                            logger.info(f"Sent to Telegram: {message}")
-                        else:
-                            response_text = await response.text()
-                            logger.warning(f"Telegram returned status {response.status}: {response_text}")
+            # If we have an image, send as photo with caption
+            # isfile over Path(...).exists(): no PurePath construction
+            # per notification, and it also rejects directories
+            if image_path and isfile(image_path):
+                url = f"/bot{self.telegram_token}/sendPhoto"
+
+                # Load, shrink and re-encode on a worker thread - both
+                # the disk read and the resize would otherwise stall
+                # the event loop for every concurrent send
+                photo = await asyncio.to_thread(self._prepare_photo, image_path)
+
+                def make_kwargs():
+                    form = aiohttp.FormData()
+                    form.add_field('chat_id', self.telegram_chat_id)
+                    form.add_field('caption', message, content_type='text/plain')
+                    form.add_field('photo', photo, filename='detection.jpg', content_type='image/jpeg')
+                    return {'data': form, 'timeout': 30}
+
+                await self._post_telegram(
+                    url, make_kwargs, f"Sent photo to Telegram: {message}"
+                )
+            else:
+                # No image or image doesn't exist - send text only
+                url = f"/bot{self.telegram_token}/sendMessage"
+                data = {
+                    'chat_id': self.telegram_chat_id,
+                    'text': message,
+                    'parse_mode': 'HTML'
+                }
+                await self._post_telegram(
+                    url,
+                    lambda: {'json': data, 'timeout': 10},
+                    f"Sent to Telegram: {message}"
+                )
         except Exception as e:
             logger.error(f"Failed to send to Telegram: {e}")
 
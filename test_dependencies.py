@@ -6,6 +6,7 @@ Tests all required dependencies before running the application.
 
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 def test_python_version():
     """Check Python version (3.11+ required for TCP push events)."""
@@ -19,18 +20,40 @@ def test_python_version():
         return False
 
 def test_dependency(name, import_name=None):
-    """Test a single Python dependency."""
+    """Test a single Python dependency (returns status, doesn't print)."""
     if import_name is None:
         import_name = name.replace('-', '_')
 
     try:
         __import__(import_name)
-        print(f"✓ {name}: OK")
         return True
     except ImportError:
-        print(f"✗ {name}: NOT INSTALLED")
         return False
 
+
+def test_dependencies(deps):
+    """Import all dependencies in parallel and report in order.
+
+    cv2, numpy and fast_alpr each take hundreds of milliseconds to
+    import; the GIL is released inside their C initializers, so
+    importing on a thread pool overlaps most of that time. Results are
+    printed afterwards so the output order stays stable.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(test_dependency, name, import_name)
+            for name, import_name in deps
+        ]
+        statuses = [future.result() for future in futures]
+
+    for (name, _), ok in zip(deps, statuses):
+        if ok:
+            print(f"✓ {name}: OK")
+        else:
+            print(f"✗ {name}: NOT INSTALLED")
+
+    return statuses
+
 def test_ffmpeg():
     """Test ffmpeg availability."""
     try:
@@ -66,16 +89,17 @@ def main():
 
     # Python dependencies
     print("Python Dependencies:")
-    results.append(test_dependency('reolink_aio'))
-    results.append(test_dependency('fast-alpr', 'fast_alpr'))
-    results.append(test_dependency('opencv-python-headless', 'cv2'))
-    results.append(test_dependency('numpy'))
-    results.append(test_dependency('PyYAML', 'yaml'))
-    results.append(test_dependency('aiosqlite'))
-    results.append(test_dependency('Flask', 'flask'))
-    results.append(test_dependency('nest-asyncio', 'nest_asyncio'))
-    results.append(test_dependency('aiohttp'))
-    results.append(test_dependency('python-dateutil', 'dateutil'))
+    results.extend(test_dependencies([
+        ('reolink_aio', None),
+        ('fast-alpr', 'fast_alpr'),
+        ('opencv-python-headless', 'cv2'),
+        ('numpy', None),
+        ('PyYAML', 'yaml'),
+        ('aiosqlite', None),
+        ('Quart', 'quart'),
+        ('aiohttp', None),
+        ('python-dateutil', 'dateutil'),
+    ]))
     print()
 
     # System dependencies
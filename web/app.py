@@ -2,11 +2,18 @@
 
 import sys
 import asyncio
+import time
 import yaml
 from pathlib import Path
-from flask import Flask, render_template, jsonify, request, send_file, redirect, url_for, flash
-import threading
-import nest_asyncio
+
+# libyaml's C loader/dumper parse and emit an order of magnitude
+# faster than the pure-Python ones; fall back when PyYAML was built
+# without it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+from quart import Quart, render_template, jsonify, request, send_from_directory, abort
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,70 +22,73 @@ from src.config import Config
 from src.database import Database
 from src.camera_client import CameraClient
 
-# Allow nested event loops (required for Flask + asyncio)
-nest_asyncio.apply()
-
-app = Flask(__name__)
+# Quart serves every handler as a coroutine on its own event loop, so
+# database and camera calls are awaited in place - no background loop
+# thread, no run_coroutine_threadsafe bridge per request
+app = Quart(__name__)
 app.config['SECRET_KEY'] = 'simplified-anpr-2025'
 
 # Load configuration
 config = Config("config.yaml")
 db = Database(config.database_path)
 
-# Initialize database
-asyncio.run(db.initialize())
-
 # Paths - use absolute path to data directory
 DATA_DIR = (Path(__file__).parent.parent / config.database_path).parent.resolve()
 
-# Camera client for settings control - initialized on first use
+# Camera client for settings control - initialized on first use.
+# Guarded by an asyncio.Lock so concurrent requests queue as waiters
+# on the loop instead of parking worker threads on an OS mutex
 camera_client = None
-camera_client_lock = threading.Lock()
-
-# Create a background event loop for camera operations
-async_loop = None
-async_thread = None
-
-
-def setup_async_loop():
-    """Setup a background event loop for async operations."""
-    global async_loop, async_thread
-    
-    if async_loop is None:
-        def run_loop():
-            global async_loop
-            async_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(async_loop)
-            async_loop.run_forever()
-        
-        async_thread = threading.Thread(target=run_loop, daemon=True)
-        async_thread.start()
-        
-        # Wait for loop to be ready
-        import time
-        while async_loop is None:
-            time.sleep(0.01)
-
-
-def run_async(coro):
-    """Helper to run async functions from sync context."""
-    global async_loop
-    
-    if async_loop is None:
-        setup_async_loop()
-    
-    future = asyncio.run_coroutine_threadsafe(coro, async_loop)
-    return future.result(timeout=10)
+camera_client_lock = asyncio.Lock()
+
+
+async def _ensure_camera_client():
+    """Create and connect the shared camera client on first use.
+
+    Must be called with camera_client_lock held.
+    """
+    global camera_client
+    if camera_client is None:
+        camera_client = CameraClient(config)
+        await camera_client.connect()
+    return camera_client
+
+# Notifier for test sends - created lazily and reused so repeated test
+# clicks share one HTTP session instead of rebuilding everything
+_notifier = None
+
+# (mtime_ns, parsed dict) for the last config.yaml read by /api/config
+_config_cache = None
+
+# Last RTSP status result - dashboards poll this every second, and the
+# answer rarely changes, so hold it for a few seconds between camera
+# round trips
+_rtsp_cache = {'t': 0.0, 'val': None}
+_RTSP_CACHE_TTL = 3.0
+
+
+@app.before_serving
+async def _initialize():
+    """Initialize the database on the serving loop."""
+    await db.initialize()
+
+
+@app.after_serving
+async def _shutdown():
+    """Release pooled resources on shutdown."""
+    if _notifier is not None:
+        await _notifier.aclose()
+    await db.close()
 
 
 @app.route('/')
-def index():
+async def index():
     """Main dashboard page."""
-    return render_template('dashboard.html', active_page='dashboard')
+    return await render_template('dashboard.html', active_page='dashboard')
 
 
 @app.route('/api/events')
-def api_events():
+async def api_events():
     """Get events with pagination and filtering."""
     page = request.args.get('page', 1, type=int)
     limit = request.args.get('limit', 20, type=int)
@@ -89,9 +99,7 @@ def api_events():
     offset = (page - 1) * limit
 
     # Get paginated events
-    events, total = run_async(
-        db.get_paginated_events(limit, offset, search, filter_type)
-    )
+    events, total = await db.get_paginated_events(limit, offset, search, filter_type)
 
     # Calculate pagination
     total_pages = (total + limit - 1) // limit
@@ -106,47 +114,71 @@ def api_events():
 
 
 @app.route('/image/<path:filename>')
-def serve_image(filename):
-    """Serve detection images."""
-    image_path = DATA_DIR / filename
+async def serve_image(filename):
+    """Serve detection images.
 
-    if image_path.exists():
-        return send_file(image_path)
-    else:
-        return "", 404
+    conditional=True emits ETag/Last-Modified and answers repeat
+    thumbnail loads with 304s, and cache_timeout lets the browser cache
+    them outright - detection images never change once written.
+    """
+    # <path:> converters allow slashes, so reject traversal explicitly
+    if '..' in filename:
+        abort(404)
+
+    return await send_from_directory(DATA_DIR, filename, conditional=True, cache_timeout=86400)
 
 
 @app.route('/config')
-def config_page():
+async def config_page():
     """Configuration page."""
-    return render_template('config.html', config=config, active_page='config')
+    return await render_template('config.html', config=config, active_page='config')
 
 
 @app.route('/docs')
-def docs_page():
+async def docs_page():
     """Documentation page."""
-    return render_template('documentation.html', active_page='docs')
+    return await render_template('documentation.html', active_page='docs')
 
 
 @app.route('/api/config', methods=['GET', 'POST'])
-def api_config():
+async def api_config():
     """Get or update configuration."""
+    global _config_cache
     config_file = Path(__file__).parent.parent / "config.yaml"
 
     if request.method == 'GET':
-        # Read current config
+        # The dashboard polls this endpoint; re-parsing YAML each time
+        # is wasted work when the file hasn't changed, so cache the
+        # parsed dict keyed by mtime - a stale cache is just one stat
+        # call away from detection
+        mtime = config_file.stat().st_mtime_ns
+        if _config_cache is not None and _config_cache[0] == mtime:
+            return jsonify(_config_cache[1])
+
         with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
+        _config_cache = (mtime, config_data)
         return jsonify(config_data)
 
     elif request.method == 'POST':
         # Update config
         try:
-            new_config = request.json
+            new_config = await request.get_json()
 
             # Write to file
             with open(config_file, 'w') as f:
-                yaml.dump(new_config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(new_config, f, Dumper=_YamlDumper,
+                          default_flow_style=False, sort_keys=False)
+
+            # The file changed - force the next GET to re-read it
+            _config_cache = None
+
+            # Drop the cached notifier so the next test send picks up
+            # the new settings
+            global _notifier
+            if _notifier is not None:
+                await _notifier.aclose()
+                _notifier = None
 
             return jsonify({'success': True, 'message': 'Configuration saved successfully!'})
         except Exception as e:
@@ -154,7 +186,7 @@ def api_config():
 
 
 @app.route('/api/reload', methods=['POST'])
-def api_reload():
+async def api_reload():
     """Trigger service reload by creating a reload signal file."""
     try:
         reload_signal = Path(__file__).parent.parent / '.reload_signal'
@@ -165,88 +197,75 @@ def api_reload():
 
 
 @app.route('/api/notifications/test', methods=['POST'])
-def api_test_notifications():
+async def api_test_notifications():
     """Test notification settings."""
-    async def send_test():
-        try:
-            # Load current config
+    global _notifier
+
+    data = await request.get_json() or {}
+    service = data.get('service', 'all')
+
+    try:
+        if _notifier is None:
             from src.notifier import Notifier
-            test_config = Config("config.yaml")
-            notifier = Notifier(test_config)
-            
-            # Get requested service from request
-            data = request.json or {}
-            service = data.get('service', 'all')
-            
-            # Send test
-            result = await notifier.send_test(service)
-            
-            if result:
-                return {'success': True, 'message': 'Test notification sent! Check your Telegram/Home Assistant.'}
-            else:
-                return {'success': False, 'message': 'No notification services enabled'}
-                
-        except Exception as e:
-            return {'success': False, 'message': f'Failed to send test: {str(e)}'}
-    
-    result = asyncio.run(send_test())
-    return jsonify(result)
+            _notifier = Notifier(Config("config.yaml"))
+
+        # Send test
+        result = await _notifier.send_test(service)
+
+        if result:
+            return jsonify({'success': True, 'message': 'Test notification sent! Check your Telegram/Home Assistant.'})
+        else:
+            return jsonify({'success': False, 'message': 'No notification services enabled'})
+
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'Failed to send test: {str(e)}'})
 
 
 @app.route('/api/camera/rtsp/status', methods=['GET'])
-def api_rtsp_status():
+async def api_rtsp_status():
     """Get RTSP status."""
-    global camera_client
-    
-    async def get_status():
-        global camera_client
-        
-        # Initialize camera client if needed
-        if camera_client is None:
-            camera_client = CameraClient(config)
-            await camera_client.connect()
-        
+    if (_rtsp_cache['val'] is not None
+            and time.monotonic() - _rtsp_cache['t'] < _RTSP_CACHE_TTL):
+        return jsonify(_rtsp_cache['val'])
+
+    async with camera_client_lock:
+        client = await _ensure_camera_client()
+
         try:
             body = [{"cmd": "GetNetPort", "action": 0, "param": {"channel": 0}}]
-            response = await camera_client.host.send(body)
-            
+            response = await client.host.send(body)
+
             if response and len(response) > 0:
                 net_port = response[0].get("value", {}).get("NetPort", {})
                 rtsp_enabled = net_port.get("rtspEnable", 0)
                 rtsp_port = net_port.get("rtspPort", 554)
-                
-                return {
+
+                result = {
                     'success': True,
                     'enabled': rtsp_enabled == 1,
                     'port': rtsp_port
                 }
-            
-            return {'success': False, 'message': 'No response from camera'}
+            else:
+                result = {'success': False, 'message': 'No response from camera'}
         except Exception as e:
-            return {'success': False, 'message': str(e)}
-    
-    with camera_client_lock:
-        result = run_async(get_status())
+            result = {'success': False, 'message': str(e)}
+
+    if result.get('success'):
+        _rtsp_cache['t'] = time.monotonic()
+        _rtsp_cache['val'] = result
     return jsonify(result)
 
 
 @app.route('/api/camera/rtsp/toggle', methods=['POST'])
-def api_rtsp_toggle():
+async def api_rtsp_toggle():
     """Toggle RTSP on/off."""
-    global camera_client
-    
-    async def toggle_rtsp():
-        global camera_client
-        
-        # Initialize camera client if needed
-        if camera_client is None:
-            camera_client = CameraClient(config)
-            await camera_client.connect()
-        
+    data = await request.get_json()
+    enable = data.get('enable', True)
+
+    async with camera_client_lock:
+        client = await _ensure_camera_client()
+
         try:
-            data = request.json
-            enable = data.get('enable', True)
-            
             body = [{
                 "cmd": "SetNetPort",
                 "action": 0,
@@ -257,38 +276,33 @@ def api_rtsp_toggle():
                     }
                 }
             }]
-            
-            response = await camera_client.host.send(body)
-            
+
+            response = await client.host.send(body)
+
             if response and response[0].get("code") == 0:
                 status = "enabled" if enable else "disabled"
-                return {
+                result = {
                     'success': True,
                     'message': f'RTSP {status} successfully'
                 }
-            
-            return {'success': False, 'message': 'Failed to change RTSP settings'}
+            else:
+                result = {'success': False, 'message': 'Failed to change RTSP settings'}
         except Exception as e:
-            return {'success': False, 'message': str(e)}
-    
-    with camera_client_lock:
-        result = run_async(toggle_rtsp())
+            result = {'success': False, 'message': str(e)}
+
+    # The cached status is stale the moment the toggle succeeds
+    if result.get('success'):
+        _rtsp_cache['val'] = None
     return jsonify(result)
 
 
 @app.route('/api/camera/settings', methods=['GET'])
-def get_camera_settings():
+async def get_camera_settings():
     """Get current camera ISP settings."""
-    global camera_client
-
     try:
-        with camera_client_lock:
-            # Create camera client if needed
-            if camera_client is None:
-                camera_client = CameraClient(config)
-                run_async(camera_client.connect())
-
-            settings = run_async(camera_client.get_isp_settings())
+        async with camera_client_lock:
+            client = await _ensure_camera_client()
+            settings = await client.get_isp_settings()
 
         if settings:
             return jsonify({'success': True, 'settings': settings})
@@ -303,21 +317,15 @@ def get_camera_settings():
 
 
 @app.route('/api/camera/settings', methods=['POST'])
-def set_camera_settings():
+async def set_camera_settings():
     """Set camera ISP settings."""
-    global camera_client
-
     try:
-        settings = request.json
+        settings = await request.get_json()
         print(f"Received settings to apply: {settings}")
 
-        with camera_client_lock:
-            # Create camera client if needed
-            if camera_client is None:
-                camera_client = CameraClient(config)
-                run_async(camera_client.connect())
-
-            success = run_async(camera_client.set_isp_settings(settings))
+        async with camera_client_lock:
+            client = await _ensure_camera_client()
+            success = await client.set_isp_settings(settings)
 
         if success:
             return jsonify({'success': True, 'message': 'Camera settings applied'})